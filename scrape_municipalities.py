@@ -46,55 +46,56 @@ def scrape_municipalities(limit: int = 100) -> List[Dict[str, Any]]:
     
     # Initialize scraper with HTTPClient
     from src.core.http_client import HTTPClient
-    http_client = HTTPClient(
+    # The with block releases the pooled keep-alive connections, also on errors
+    with HTTPClient(
         default_delay=0.5,
         use_cache=True,
         max_retries=3,
         timeout=30
-    )
-    scraper = SmartMunicipalScraper(http_client=http_client)
-    
-    all_results = []
-    start_time = time.time()
-    
-    # Take the first 'limit' municipalities
-    urls_to_scrape = urls_df.head(limit)
-    
-    for idx, row in urls_to_scrape.iterrows():
-        municipality = row.get('municipality', 'Unknown')
-        url = row.get('url', '')
+    ) as http_client:
+        scraper = SmartMunicipalScraper(http_client=http_client)
         
-        if not url:
-            continue
+        all_results = []
+        start_time = time.time()
         
-        print(f"[{idx+1}/{limit}] 🏛️  {municipality}")
+        # Take the first 'limit' municipalities
+        urls_to_scrape = urls_df.head(limit)
         
-        try:
-            results = scraper.scrape(url)
+        for idx, row in urls_to_scrape.iterrows():
+            municipality = row.get('municipality', 'Unknown')
+            url = row.get('url', '')
+            
+            if not url:
+                continue
             
-            if results:
-                # Add municipality info
-                for result in results:
-                    result['municipality'] = municipality
-                    result['scraped_url'] = url
-                    result['scraped_at'] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+            print(f"[{idx+1}/{limit}] 🏛️  {municipality}")
+            
+            try:
+                results = scraper.scrape(url)
                 
-                all_results.extend(results)
-                print(f"  ✅ Found {len(results)} officials/elections")
-            else:
-                print(f"  ⚠️  No data found")
-        
-        except Exception as e:
-            print(f"  ❌ Error: {e}")
-            continue
-        
-        # Progress update every 10
-        if (idx + 1) % 10 == 0:
-            elapsed = time.time() - start_time
-            rate = (idx + 1) / (elapsed / 60)
-            print(f"\n  📊 Progress: {idx+1}/{limit} ({(idx+1)/limit*100:.1f}%)")
-            print(f"  ⏱️  Speed: {rate:.1f} municipalities/minute")
-            print(f"  ✅ Total collected: {len(all_results)} records\n")
+                if results:
+                    # Add municipality info
+                    for result in results:
+                        result['municipality'] = municipality
+                        result['scraped_url'] = url
+                        result['scraped_at'] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+                    
+                    all_results.extend(results)
+                    print(f"  ✅ Found {len(results)} officials/elections")
+                else:
+                    print(f"  ⚠️  No data found")
+            
+            except Exception as e:
+                print(f"  ❌ Error: {e}")
+                continue
+            
+            # Progress update every 10
+            if (idx + 1) % 10 == 0:
+                elapsed = time.time() - start_time
+                rate = (idx + 1) / (elapsed / 60)
+                print(f"\n  📊 Progress: {idx+1}/{limit} ({(idx+1)/limit*100:.1f}%)")
+                print(f"  ⏱️  Speed: {rate:.1f} municipalities/minute")
+                print(f"  ✅ Total collected: {len(all_results)} records\n")
     
     # Final stats
     elapsed = time.time() - start_time
@@ -2,6 +2,7 @@
 Configuration loader for YAML config files.
 """
 
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, Optional
 import yaml
@@ -120,10 +121,14 @@ def get_config(config_path: str = "config/config.yaml") -> Config:
     return _config
 
 
+@lru_cache(maxsize=1)
 def load_sources(sources_path: str = "config/sources.yaml") -> Dict[str, Any]:
     """
     Load sources configuration.
     
+    The parsed file is cached and shared by every scraper, so callers must
+    treat it as read-only. Call load_sources.cache_clear() to pick up edits.
+    
     Args:
         sources_path: Path to sources file
         
@@ -4,6 +4,7 @@ HTTP client with rate limiting, caching, retries, and compliance.
 
 import time
 import hashlib
+import threading
 from pathlib import Path
 from typing import Optional, Dict, Any
 from urllib.parse import urlparse
@@ -17,6 +18,48 @@ from requests_cache import CachedSession
 from ..core.logger import get_logger
 
 
+def _accept_encoding() -> str:
+    """
+    Content codings to advertise.
+    
+    Brotli is only offered when a brotli module is installed, since
+    urllib3 needs one to decode it.
+    """
+    try:
+        import brotli  # noqa: F401
+    except ImportError:
+        try:
+            import brotlicffi  # noqa: F401
+        except ImportError:
+            return 'gzip, deflate'
+    return 'gzip, deflate, br'
+
+
+def detect_shift_jis(body: bytes, apparent_encoding: Optional[str]) -> Optional[str]:
+    """
+    Shift_JIS-family encoding to decode a page with, if it uses one.
+    
+    Many Japanese government sites use Shift_JIS, often without declaring
+    it in the Content-Type header. It is taken from charset detection, or
+    from a meta tag / XML header near the start of the page.
+    
+    Args:
+        body: Page bytes (or the start of them)
+        apparent_encoding: Encoding detected from the bytes
+        
+    Returns:
+        Encoding name, or None to keep the declared encoding
+    """
+    if apparent_encoding and apparent_encoding.upper() in ['SHIFT_JIS', 'SHIFT-JIS', 'CP932']:
+        return apparent_encoding
+    
+    head = body[:500].lower()
+    if b'shift_jis' in head or b'shift-jis' in head:
+        return 'shift_jis'
+    
+    return None
+
+
 class HTTPClient:
     """
     Production-grade HTTP client with:
@@ -37,6 +80,8 @@ class HTTPClient:
         cache_dir: str = "data/cache",
         cache_expire_after: int = 86400,
         user_agent: str = "PublicOfficialsScraper/1.0 (Research)",
+        pool_connections: int = 20,
+        pool_maxsize: int = 50,
     ):
         """
         Initialize HTTP client.
@@ -50,6 +95,8 @@ class HTTPClient:
             cache_dir: Cache directory path
             cache_expire_after: Cache expiration in seconds
             user_agent: User-Agent header
+            pool_connections: Number of per-host connection pools to keep
+            pool_maxsize: Maximum connections kept alive per host
         """
         self.logger = get_logger(__name__)
         self.default_delay = default_delay
@@ -63,6 +110,11 @@ class HTTPClient:
         # robots.txt parsers per domain
         self._robots_parsers: Dict[str, RobotFileParser] = {}
         
+        # One lock per domain, so threads sharing the client wait their turn
+        # for the delay and load robots.txt once
+        self._domain_locks: Dict[str, threading.Lock] = {}
+        self._domain_locks_lock = threading.Lock()
+        
         # Setup session
         if use_cache:
             cache_path = Path(cache_dir)
@@ -72,8 +124,12 @@ class HTTPClient:
                 expire_after=cache_expire_after,
                 allowable_methods=('GET', 'HEAD'),
             )
+            # Streamed requests skip the cache: on a miss a CachedSession
+            # reads and stores the whole body, which defeats streaming
+            self._stream_session = requests.Session()
         else:
             self.session = requests.Session()
+            self._stream_session = self.session
         
         # Configure retries
         retry_strategy = Retry(
@@ -82,28 +138,48 @@ class HTTPClient:
             status_forcelist=[429, 500, 502, 503, 504],
             allowed_methods=["HEAD", "GET", "OPTIONS"]
         )
-        adapter = HTTPAdapter(max_retries=retry_strategy)
-        self.session.mount("http://", adapter)
-        self.session.mount("https://", adapter)
-        
-        # Set default headers
-        self.session.headers.update({
-            'User-Agent': self.user_agent,
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
-            'Accept-Language': 'ja,en-US;q=0.7,en;q=0.3',
-            'Accept-Encoding': 'gzip, deflate',
-            'DNT': '1',
-            'Connection': 'keep-alive',
-            'Upgrade-Insecure-Requests': '1',
-        })
+        for session in self._sessions():
+            # Keep a pool per host so repeat requests to a portal reuse connections
+            adapter = HTTPAdapter(
+                max_retries=retry_strategy,
+                pool_connections=pool_connections,
+                pool_maxsize=pool_maxsize,
+                pool_block=False,
+            )
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            
+            # Set default headers
+            session.headers.update({
+                'User-Agent': self.user_agent,
+                'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+                'Accept-Language': 'ja,en-US;q=0.7,en;q=0.3',
+                'Accept-Encoding': _accept_encoding(),
+                'DNT': '1',
+                'Connection': 'keep-alive',
+                'Upgrade-Insecure-Requests': '1',
+            })
         
         self.logger.info(f"HTTPClient initialized: delay={default_delay}s, cache={use_cache}")
     
+    def _sessions(self):
+        """The cached session, plus the uncached one used for streaming."""
+        if self._stream_session is self.session:
+            return [self.session]
+        return [self.session, self._stream_session]
+    
     def _get_domain(self, url: str) -> str:
         """Extract domain from URL."""
         parsed = urlparse(url)
         return parsed.netloc
     
+    def _domain_lock(self, domain: str) -> threading.Lock:
+        """Get (or create) the lock guarding a domain's request state."""
+        with self._domain_locks_lock:
+            if domain not in self._domain_locks:
+                self._domain_locks[domain] = threading.Lock()
+            return self._domain_locks[domain]
+    
     def _check_robots_txt(self, url: str) -> bool:
         """
         Check if URL is allowed by robots.txt.
@@ -120,21 +196,23 @@ class HTTPClient:
         domain = self._get_domain(url)
         
         # Get or create parser for this domain
-        if domain not in self._robots_parsers:
-            parser = RobotFileParser()
-            robots_url = f"{urlparse(url).scheme}://{domain}/robots.txt"
+        with self._domain_lock(domain):
+            if domain not in self._robots_parsers:
+                parser = RobotFileParser()
+                robots_url = f"{urlparse(url).scheme}://{domain}/robots.txt"
+                
+                try:
+                    parser.set_url(robots_url)
+                    parser.read()
+                    self._robots_parsers[domain] = parser
+                    self.logger.debug(f"Loaded robots.txt for {domain}")
+                except Exception as e:
+                    self.logger.warning(f"Could not load robots.txt for {domain}: {e}")
+                    # Allow by default if robots.txt unavailable
+                    return True
             
-            try:
-                parser.set_url(robots_url)
-                parser.read()
-                self._robots_parsers[domain] = parser
-                self.logger.debug(f"Loaded robots.txt for {domain}")
-            except Exception as e:
-                self.logger.warning(f"Could not load robots.txt for {domain}: {e}")
-                # Allow by default if robots.txt unavailable
-                return True
+            parser = self._robots_parsers[domain]
         
-        parser = self._robots_parsers[domain]
         can_fetch = parser.can_fetch(self.user_agent, url)
         
         if not can_fetch:
@@ -146,20 +224,24 @@ class HTTPClient:
         """
         Enforce rate limiting for domain.
         
+        The domain's lock is held while sleeping, so concurrent callers for
+        one domain are spaced by the delay rather than all passing the check.
+        
         Args:
             domain: Domain to rate limit
             delay: Custom delay (uses default if None)
         """
         delay = delay or self.default_delay
         
-        if domain in self._last_request_time:
-            elapsed = time.time() - self._last_request_time[domain]
-            if elapsed < delay:
-                sleep_time = delay - elapsed
-                self.logger.debug(f"Rate limiting {domain}: sleeping {sleep_time:.2f}s")
-                time.sleep(sleep_time)
-        
-        self._last_request_time[domain] = time.time()
+        with self._domain_lock(domain):
+            if domain in self._last_request_time:
+                elapsed = time.time() - self._last_request_time[domain]
+                if elapsed < delay:
+                    sleep_time = delay - elapsed
+                    self.logger.debug(f"Rate limiting {domain}: sleeping {sleep_time:.2f}s")
+                    time.sleep(sleep_time)
+            
+            self._last_request_time[domain] = time.time()
     
     def get(
         self,
@@ -171,6 +253,9 @@ class HTTPClient:
         """
         Perform GET request with rate limiting and compliance.
         
+        Streamed requests (stream=True) bypass the response cache, so only
+        the part of the body the caller reads is downloaded.
+        
         Args:
             url: URL to fetch
             delay: Custom delay for this request
@@ -192,32 +277,29 @@ class HTTPClient:
         domain = self._get_domain(url)
         self._rate_limit(domain, delay)
         
-        # Merge headers
-        req_headers = self.session.headers.copy()
-        if headers:
-            req_headers.update(headers)
-        
         # Make request
         self.logger.debug(f"GET {url}")
         
         try:
-            response = self.session.get(
+            # The session merges its default headers (and keeps the pooled
+            # keep-alive connection); only per-request extras are passed
+            session = self._stream_session if kwargs.get('stream') else self.session
+            response = session.get(
                 url,
-                headers=req_headers,
+                headers=headers,
                 timeout=self.timeout,
                 **kwargs
             )
             response.raise_for_status()
             
             # Auto-detect encoding for Japanese content
-            # Many Japanese government sites use Shift_JIS
-            if response.apparent_encoding and response.apparent_encoding.upper() in ['SHIFT_JIS', 'SHIFT-JIS', 'CP932']:
-                response.encoding = response.apparent_encoding
-                self.logger.debug(f"Using encoding: {response.encoding}")
-            elif 'shift_jis' in response.text.lower()[:500] or 'shift-jis' in response.text.lower()[:500]:
-                # Check if HTML declares Shift_JIS in meta tag or XML header
-                response.encoding = 'shift_jis'
-                self.logger.debug(f"Detected Shift_JIS in HTML, using encoding: {response.encoding}")
+            # (streamed bodies are decoded by the caller, since detection
+            # would read the whole body)
+            if not kwargs.get('stream'):
+                encoding = detect_shift_jis(response.content, response.apparent_encoding)
+                if encoding:
+                    response.encoding = encoding
+                    self.logger.debug(f"Using encoding: {response.encoding}")
             
             # Log cache status if available
             if hasattr(response, 'from_cache'):
@@ -261,5 +343,14 @@ class HTTPClient:
     
     def close(self):
         """Close session and cleanup."""
-        self.session.close()
+        for session in self._sessions():
+            session.close()
         self.logger.info("HTTPClient closed")
+    
+    def __enter__(self) -> "HTTPClient":
+        """Use the client in a with block, which closes it on exit."""
+        return self
+    
+    def __exit__(self, exc_type, exc, tb):
+        """Close the client, also when the block raised."""
+        self.close()
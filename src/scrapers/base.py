@@ -4,7 +4,10 @@ Base scraper class with common functionality.
 
 from abc import ABC, abstractmethod
 from typing import List, Dict, Any, Optional
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from urllib.parse import urlparse
+import asyncio
 import hashlib
 
 from ..core.http_client import HTTPClient
@@ -94,6 +97,15 @@ class BaseScraper(ABC):
         """
         self.results.append(record)
     
+    def add_results(self, records: List[Dict[str, Any]]):
+        """
+        Add a batch of records to results.
+        
+        Args:
+            records: Data records
+        """
+        self.results.extend(records)
+    
     def clear_results(self):
         """Clear collected results."""
         self.results = []
@@ -101,3 +113,66 @@ class BaseScraper(ABC):
     def get_results(self) -> List[Dict[str, Any]]:
         """Get collected results."""
         return self.results
+    
+    def fetch_pages(self, urls: List[str], max_concurrent: int = 10) -> List[Optional[str]]:
+        """
+        Fetch page bodies through the HTTP client, different hosts in parallel.
+        
+        Each host's URLs are fetched in order on one worker thread, so
+        robots.txt, the per-domain delay, caching, retries and encoding
+        detection apply exactly as for a single get; only requests to
+        different hosts overlap.
+        
+        Args:
+            urls: URLs to fetch
+            max_concurrent: Maximum number of hosts fetched at once
+            
+        Returns:
+            One body per URL in input order (None where the fetch failed)
+        """
+        pages: List[Optional[str]] = [None] * len(urls)
+        by_host: Dict[str, List[int]] = {}
+        for index, url in enumerate(urls):
+            by_host.setdefault(urlparse(url).netloc, []).append(index)
+        
+        def fetch_host(indices: List[int]):
+            for index in indices:
+                response = self.http.get_safe(urls[index])
+                pages[index] = response.text if response else None
+        
+        workers = max(1, min(max_concurrent, len(by_host)))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            list(executor.map(fetch_host, by_host.values()))
+        
+        return pages
+    
+    async def _get_text_async(
+        self,
+        url: str,
+        semaphore: Optional[asyncio.Semaphore] = None,
+    ) -> str:
+        """
+        Fetch a page body through the HTTP client without blocking the event loop.
+        
+        The blocking get runs in a worker thread, so robots.txt, the
+        per-domain delay, caching, retries and encoding detection apply as
+        for a synchronous get. The client's rate limiter is thread-safe, so
+        the delay also holds between concurrent coroutines.
+        
+        Args:
+            url: URL to fetch
+            semaphore: Shared semaphore bounding in-flight requests
+            
+        Returns:
+            Page text
+            
+        Raises:
+            requests.RequestException: On request failure
+            PermissionError: If blocked by robots.txt
+        """
+        if semaphore is None:
+            response = await asyncio.to_thread(self.http.get, url)
+        else:
+            async with semaphore:
+                response = await asyncio.to_thread(self.http.get, url)
+        return response.text
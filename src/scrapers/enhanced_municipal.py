@@ -5,15 +5,54 @@ Extracts comprehensive information about assembly members including:
 """
 
 import re
+import asyncio
 import logging
-from typing import Dict, List, Optional, Any, Set
+from io import BytesIO
+from typing import Dict, List, Optional, Any, Set, Tuple
 from urllib.parse import urljoin, urlparse
 from bs4 import BeautifulSoup, Tag
+from lxml import etree
+from dataclasses import dataclass, asdict
 from datetime import datetime
 
 from src.scrapers.base import BaseScraper
 from src.utils.parsers import parse_html
 
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:  # optional fast path, falls back to BeautifulSoup
+    LexborHTMLParser = None
+
+
+@dataclass(slots=True)
+class MunicipalOfficial:
+    """Assembly member record extracted from a municipal page."""
+    
+    name: str
+    municipality: str = 'Unknown'
+    prefecture: str = 'Unknown'
+    source_url: str = ''
+    extraction_method: str = ''
+    last_updated: str = ''
+    party: str = ''
+    age: Optional[int] = None
+    election_count: Optional[int] = None
+    region: str = ''
+    twitter: str = ''
+    facebook: str = ''
+    instagram: str = ''
+    youtube: str = ''
+    line: str = ''
+    official_website: str = ''
+    
+    def as_dict(self) -> Dict[str, Any]:
+        """Convert to the flat dict used by exporters (missing numbers become '')."""
+        data = asdict(self)
+        for key in ('age', 'election_count'):
+            if data[key] is None:
+                data[key] = ''
+        return data
+
 
 class EnhancedMunicipalScraper(BaseScraper):
     """
@@ -29,6 +68,16 @@ class EnhancedMunicipalScraper(BaseScraper):
         '議員プロフィール', '議員の紹介',
         'council', 'assembly', 'member', 'legislator'
     ]
+    LIST_PAGE_KEYWORD_RE = re.compile('|'.join(map(re.escape, LIST_PAGE_KEYWORDS)))
+    
+    # Results a strategy must yield before the remaining strategies are skipped
+    MIN_OFFICIALS_PER_PAGE = 3
+    
+    # Pages larger than this are stream-parsed container by container
+    STREAMING_THRESHOLD_BYTES = 2 * 1024 * 1024
+    STREAM_LIST_TAGS = ('table', 'ul', 'ol')
+    STREAM_BLOCK_TAGS = ('div', 'article')
+    MEMBER_CLASS_RE = re.compile(r'(member|official|profile|giin)', re.I)
     
     # Japanese name patterns (family name + given name)
     NAME_PATTERNS = [
@@ -37,66 +86,84 @@ class EnhancedMunicipalScraper(BaseScraper):
         r'[\u30a0-\u30ff]{2,8}',  # Katakana: ヤマダタロウ
     ]
     
+    # Words that rule a candidate out as a person's name
+    EXCLUDED_NAME_WORDS = [
+        '議員', '市議', '区議', '町議', '村議', '県議', '都議', '府議', '道議',
+        '議長', '副議長', '委員長', '委員', '会長', '副会長',
+        '住民', '登録', '相談', '窓口', '受付', '案内', '情報', '一覧', '名簿',
+        '上下水道', '浄化槽', '除雪', '道路', '河川', '動物', 'ペット',
+        '墓地', '墓園', '消費', '生活', 'くらし', '住まい', '土地'
+    ]
+    EXCLUDED_NAME_CHARS = frozenset(''.join(EXCLUDED_NAME_WORDS))
+    
     # Political party keywords
     PARTY_KEYWORDS = [
         '自民党', '自由民主党', '立憲民主党', '公明党', '共産党', '日本共産党',
         '国民民主党', '維新', '日本維新の会', '社民党', '社会民主党',
         'れいわ', 'れいわ新選組', 'NHK党', '無所属', '市民', '県民', '都民'
     ]
+    # One pass finds every (possibly overlapping) keyword; earlier list entries win
+    PARTY_KEYWORD_RE = re.compile('(?=(' + '|'.join(map(re.escape, PARTY_KEYWORDS)) + '))')
+    PARTY_PRIORITY = {party: rank for rank, party in enumerate(PARTY_KEYWORDS)}
     
-    # Age/birthday patterns
-    AGE_PATTERNS = [
-        r'(\d{1,2})歳',  # 45歳
-        r'年齢[：:]\s*(\d{1,2})',  # 年齢：45
-        r'(\d{4})年(\d{1,2})月(\d{1,2})日生',  # 1970年5月15日生
-        r'昭和(\d{1,2})年',  # 昭和45年
-        r'平成(\d{1,2})年',  # 平成5年
-    ]
+    # Link text / hrefs used to identify an official website
+    WEBSITE_KEYWORD_RE = re.compile('公式|ホームページ|HP|Website|Official')
+    SOCIAL_HOST_RE = re.compile('twitter|facebook|instagram|youtube')
     
-    # Election count patterns
-    ELECTION_PATTERNS = [
-        r'(\d+)期',  # 3期
-        r'(\d+)回当選',  # 3回当選
-        r'当選回数[：:]\s*(\d+)',  # 当選回数：3
-    ]
+    # Age, election count and region features, scanned in a single pass per row.
+    # Each alternative sits inside the lookahead so overlapping hits are still seen.
+    COMBINED_INFO_RE = re.compile(
+        r'(?=(?P<age_years>\d{1,2})歳'  # 45歳
+        r'|年齢[：:]\s*(?P<age_label>\d{1,2})'  # 年齢：45
+        r'|(?P<terms>\d+)期'  # 3期
+        r'|(?P<wins>\d+)回当選'  # 3回当選
+        r'|当選回数[：:]\s*(?P<win_count>\d+)'  # 当選回数：3
+        r'|(?P<ward_number>[1-9]区)'  # 1区, 2区
+        r'|(?P<ward_direction>[東西南北中][部区])'  # 東部, 西区
+        r'|(?P<ward_kana>[あ-ん]{2,5}区))'  # ひらがな区名
+    )
+    
+    # Groups feeding each feature, highest priority first. The ward patterns
+    # stay in separate groups so a numbered ward still beats an earlier kana one.
+    INFO_GROUPS = {
+        'age': ('age_years', 'age_label'),
+        'election_count': ('terms', 'wins', 'win_count'),
+        'region': ('ward_number', 'ward_direction', 'ward_kana'),
+    }
     
     # Social media patterns
-    SOCIAL_PATTERNS = {
-        'twitter': [
-            r'twitter\.com/([a-zA-Z0-9_]+)',
-            r'x\.com/([a-zA-Z0-9_]+)',
-        ],
-        'facebook': [
-            r'facebook\.com/([a-zA-Z0-9._]+)',
-            r'fb\.com/([a-zA-Z0-9._]+)',
-        ],
-        'instagram': [
-            r'instagram\.com/([a-zA-Z0-9._]+)',
-        ],
-        'youtube': [
-            r'youtube\.com/(c/|channel/|user/)?([a-zA-Z0-9_-]+)',
-        ],
-        'line': [
-            r'line\.me/R/ti/p/(@[a-zA-Z0-9_]+)',
-        ]
+    # One pattern per platform; group 1 is always the handle
+    SOCIAL_RE = {
+        'twitter': re.compile(r'(?:twitter|x)\.com/([a-zA-Z0-9_]+)', re.I),
+        'facebook': re.compile(r'(?:facebook|fb)\.com/([a-zA-Z0-9._]+)', re.I),
+        'instagram': re.compile(r'instagram\.com/([a-zA-Z0-9._]+)', re.I),
+        'youtube': re.compile(r'youtube\.com/(?:c/|channel/|user/)?([a-zA-Z0-9_-]+)', re.I),
+        'line': re.compile(r'line\.me/R/ti/p/(@[a-zA-Z0-9_]+)', re.I),
     }
     
     def __init__(self, *args, **kwargs):
         """Initialize enhanced municipal scraper."""
         super().__init__(*args, **kwargs)
         self.visited_urls: Set[str] = set()
+        self._response_cache: Dict[str, Any] = {}
+        self._strategy_cache: Dict[str, str] = {}  # netloc -> winning strategy name
+        self._scrape_timestamp = self._format_timestamp()
         self.logger = logging.getLogger(__name__)
     
     def scrape(self, url: str) -> List[Dict[str, Any]]:
         """Required by BaseScraper - delegates to scrape_municipality."""
-        return self.scrape_municipality(url)
+        return [official.as_dict() for official in self.scrape_municipality(url)]
+    
+    def _format_timestamp(self) -> str:
+        """Timestamp stamped on every record of one scrape run."""
+        return datetime.now().strftime('%Y-%m-%d %H:%M:%S')
     
     def scrape_municipality(
         self,
         base_url: str,
         municipality_name: Optional[str] = None,
         prefecture: Optional[str] = None,
-    ) -> List[Dict[str, Any]]:
+    ) -> List[MunicipalOfficial]:
         """
         Scrape comprehensive information about assembly members.
         
@@ -110,6 +177,8 @@ class EnhancedMunicipalScraper(BaseScraper):
         """
         self.logger.info(f"🏛️  Scraping municipality: {municipality_name or base_url}")
         self.visited_urls.clear()
+        self._response_cache.clear()
+        self._scrape_timestamp = self._format_timestamp()
         
         officials = []
         
@@ -122,15 +191,22 @@ class EnhancedMunicipalScraper(BaseScraper):
                 return []
             
             self.logger.info(f"✓ Found {len(list_pages)} potential list pages")
+            extracted_pages: Set[str] = set()
+            seen_names: Set[str] = set()
             
             # Step 2: Extract officials from each page
             for page_url in list_pages[:5]:  # Limit to top 5 pages
+                if page_url in extracted_pages:
+                    continue
+                extracted_pages.add(page_url)
+                
                 try:
                     self.logger.info(f"📄 Extracting from: {page_url}")
                     page_officials = self._extract_officials_from_page(
                         page_url,
                         municipality_name,
-                        prefecture
+                        prefecture,
+                        seen_names,
                     )
                     
                     if page_officials:
@@ -141,10 +217,7 @@ class EnhancedMunicipalScraper(BaseScraper):
                     self.logger.error(f"❌ Failed to extract from {page_url}: {e}")
                     continue
             
-            # Step 3: Deduplicate by name
-            officials = self._deduplicate_officials(officials)
-            
-            # Step 4: Validate and clean data
+            # Step 3: Validate and clean data (names are deduplicated during extraction)
             officials = self._validate_officials(officials)
             
             self.logger.info(f"✅ Extracted {len(officials)} officials from {municipality_name or base_url}")
@@ -157,39 +230,66 @@ class EnhancedMunicipalScraper(BaseScraper):
     
     def _find_official_list_pages(self, base_url: str, max_depth: int = 2) -> List[str]:
         """Find pages that contain assembly member lists."""
-        list_pages = []
-        
         try:
-            response = self.http.get(base_url)
+            response = self._get(base_url)
             if not response:
                 return []
             
-            soup = parse_html(response.text)
-            if not soup:
-                return []
-            
-            # Find all links
-            links = soup.find_all('a', href=True)
-            
-            for link in links:
-                href = link.get('href', '')
-                text = link.get_text(strip=True)
-                
-                # Check if link text contains keywords
-                if any(keyword in text for keyword in self.LIST_PAGE_KEYWORDS):
-                    full_url = urljoin(base_url, href)
-                    
-                    # Avoid duplicates and external sites
-                    if full_url not in list_pages and self._is_same_domain(base_url, full_url):
-                        list_pages.append(full_url)
-            
-            # If no specific pages found, try the base URL
-            if not list_pages:
-                list_pages.append(base_url)
+            return self._find_list_pages_in_html(response.text, base_url)
             
         except Exception as e:
             self.logger.error(f"Error finding list pages: {e}")
-            list_pages.append(base_url)  # Fallback to base URL
+            return [base_url]  # Fallback to base URL
+    
+    def _get(self, url: str) -> Any:
+        """Fetch URL once per scrape_municipality call, serving repeats from memory."""
+        response = self._response_cache.get(url)
+        if response is None:
+            response = self.http.get(url)
+            self._response_cache[url] = response
+            self.visited_urls.add(url)
+        return response
+    
+    def _iter_links(self, html: str):
+        """Yield (href, stripped link text) for every <a href> on the page."""
+        if LexborHTMLParser is not None:
+            # lexbor builds and walks the tree in C; this is the hot path on nav-heavy index pages
+            for node in LexborHTMLParser(html).css('a[href]'):
+                yield node.attributes.get('href') or '', node.text(deep=True, separator='', strip=True)
+            return
+        
+        soup = parse_html(html)
+        for link in soup.find_all('a', href=True):
+            yield link.get('href', ''), link.get_text(strip=True)
+    
+    def _find_list_pages_in_html(self, html: str, base_url: str) -> List[str]:
+        """Collect same-domain links whose text looks like a member list."""
+        list_pages: List[str] = []
+        seen: Set[str] = set()
+        base_netloc = urlparse(base_url).netloc
+        
+        for href, text in self._iter_links(html):
+            # Check if link text contains keywords (single scan over all keywords)
+            if self.LIST_PAGE_KEYWORD_RE.search(text):
+                try:
+                    full_url = urljoin(base_url, href)
+                    netloc = urlparse(full_url).netloc
+                except ValueError:
+                    continue
+                
+                # Avoid duplicates and external sites
+                is_same_domain = (
+                    netloc == base_netloc
+                    or netloc.endswith(base_netloc)
+                    or base_netloc.endswith(netloc)
+                )
+                if full_url not in seen and is_same_domain:
+                    seen.add(full_url)
+                    list_pages.append(full_url)
+        
+        # If no specific pages found, try the base URL
+        if not list_pages:
+            list_pages.append(base_url)
         
         return list_pages
     
@@ -198,53 +298,315 @@ class EnhancedMunicipalScraper(BaseScraper):
         page_url: str,
         municipality_name: Optional[str],
         prefecture: Optional[str],
-    ) -> List[Dict[str, Any]]:
+        seen_names: Optional[Set[str]] = None,
+    ) -> List[MunicipalOfficial]:
         """Extract detailed official information from a page."""
-        officials = []
-        
         try:
-            response = self.http.get(page_url)
+            response = self._get(page_url)
             if not response:
                 return []
             
-            soup = parse_html(response.text)
-            if not soup:
+            if len(response.content) > self.STREAMING_THRESHOLD_BYTES:
+                return self._extract_officials_streaming(
+                    response.content, page_url, municipality_name, prefecture, seen_names,
+                    encoding=response.encoding,
+                )
+            
+            return self._extract_officials_from_html(
+                response.text, page_url, municipality_name, prefecture, seen_names
+            )
+            
+        except Exception as e:
+            self.logger.error(f"Error extracting from page: {e}")
+            return []
+    
+    def _extract_officials_from_html(
+        self,
+        html: str,
+        page_url: str,
+        municipality_name: Optional[str],
+        prefecture: Optional[str],
+        seen_names: Optional[Set[str]] = None,
+    ) -> List[MunicipalOfficial]:
+        """
+        Run the extraction strategies over an already fetched page.
+        
+        Names already in seen_names (from earlier pages) are dropped, and
+        names from the winning strategy are added to it. The first strategy
+        yielding MIN_OFFICIALS_PER_PAGE officials wins; otherwise the one
+        with the most results does.
+        """
+        officials = []
+        if seen_names is None:
+            seen_names = set()
+        
+        soup = parse_html(html)
+        if not soup:
+            return []
+        
+        # Try multiple extraction strategies
+        strategies = [
+            self._extract_from_table,
+            self._extract_from_list,
+            self._extract_from_cards,
+            self._extract_from_divs,
+        ]
+        
+        # Start with the strategy that last produced a full result on this site
+        domain = urlparse(page_url).netloc
+        preferred = self._strategy_cache.get(domain)
+        strategies.sort(key=lambda strategy: strategy.__name__ != preferred)
+        
+        best_strategy = None
+        best_results: List[MunicipalOfficial] = []
+        best_names: Set[str] = set()
+        
+        for strategy in strategies:
+            try:
+                # Each attempt dedupes within the page; only the winner's names are kept
+                attempt_names: Set[str] = set()
+                results = strategy(soup, page_url, municipality_name, prefecture, attempt_names)
+                
+                # Filter out navigation items
+                valid_results = [r for r in results or [] if self._is_valid_official(r)]
+                if len(valid_results) > len(best_results):
+                    best_strategy, best_results, best_names = strategy, valid_results, attempt_names
+                
+                # A stray match or two is not enough to skip the remaining strategies
+                if len(valid_results) >= self.MIN_OFFICIALS_PER_PAGE:
+                    self._strategy_cache[domain] = strategy.__name__
+                    break
+            except Exception as e:
+                self.logger.debug(f"  Strategy {strategy.__name__} failed: {e}")
+                continue
+        
+        if best_strategy is not None:
+            self.logger.info(f"  ✓ Strategy succeeded: {best_strategy.__name__} ({len(best_results)} officials)")
+            officials.extend(r for r in best_results if r.name not in seen_names)
+            seen_names.update(best_names)
+        
+        return officials
+    
+    def _is_stream_container(self, elem: Any) -> bool:
+        """Check if an lxml element holds records for one of the strategies."""
+        if elem.tag in self.STREAM_LIST_TAGS:
+            return True
+        return elem.tag in self.STREAM_BLOCK_TAGS and bool(self.MEMBER_CLASS_RE.search(elem.get('class') or ''))
+    
+    def _extract_officials_streaming(
+        self,
+        content: bytes,
+        page_url: str,
+        municipality_name: Optional[str],
+        prefecture: Optional[str],
+        seen_names: Optional[Set[str]] = None,
+        encoding: Optional[str] = None,
+    ) -> List[MunicipalOfficial]:
+        """
+        Run the extraction strategies over a large page without building its full tree.
+        
+        Each outermost table/list/member block is parsed on its own as soon
+        as it closes and then freed, so memory stays bounded by the largest
+        container instead of the page. Winner selection matches
+        _extract_officials_from_html.
+        
+        Args:
+            content: Raw page bytes
+            page_url: URL the page was fetched from
+            municipality_name: Name of municipality
+            prefecture: Prefecture name
+            seen_names: Names already extracted from earlier pages
+            encoding: Declared response encoding (defaults to UTF-8)
+            
+        Returns:
+            List of officials from the winning strategy
+        """
+        officials = []
+        if seen_names is None:
+            seen_names = set()
+        
+        strategies = [
+            self._extract_from_table,
+            self._extract_from_list,
+            self._extract_from_cards,
+            self._extract_from_divs,
+        ]
+        domain = urlparse(page_url).netloc
+        preferred = self._strategy_cache.get(domain)
+        strategies.sort(key=lambda strategy: strategy.__name__ != preferred)
+        
+        collected: Dict[str, List[MunicipalOfficial]] = {s.__name__: [] for s in strategies}
+        attempt_names: Dict[str, Set[str]] = {s.__name__: set() for s in strategies}
+        
+        events = etree.iterparse(
+            BytesIO(content),
+            events=('end',),
+            tag=self.STREAM_LIST_TAGS + self.STREAM_BLOCK_TAGS,
+            html=True,
+            recover=True,
+            encoding=encoding or 'utf-8',
+        )
+        try:
+            for _, elem in events:
+                if not self._is_stream_container(elem):
+                    continue
+                # Nested containers are handled when their outermost container closes
+                ancestors = elem.iterancestors(*self.STREAM_LIST_TAGS, *self.STREAM_BLOCK_TAGS)
+                if any(self._is_stream_container(a) for a in ancestors):
+                    continue
+                
+                fragment = parse_html(etree.tostring(elem, encoding='unicode'))
+                for strategy in strategies:
+                    name = strategy.__name__
+                    try:
+                        collected[name].extend(
+                            strategy(fragment, page_url, municipality_name, prefecture, attempt_names[name])
+                        )
+                    except Exception as e:
+                        self.logger.debug(f"  Strategy {name} failed: {e}")
+                
+                # Release the processed container and everything before it
+                elem.clear()
+                while elem.getprevious() is not None:
+                    del elem.getparent()[0]
+        except etree.LxmlError as e:
+            self.logger.warning(f"Streaming parse stopped early on {page_url}: {e}")
+        
+        best_strategy = None
+        best_results: List[MunicipalOfficial] = []
+        for strategy in strategies:
+            valid_results = [r for r in collected[strategy.__name__] if self._is_valid_official(r)]
+            if len(valid_results) > len(best_results):
+                best_strategy, best_results = strategy, valid_results
+            if len(valid_results) >= self.MIN_OFFICIALS_PER_PAGE:
+                self._strategy_cache[domain] = strategy.__name__
+                break
+        
+        if best_strategy is not None:
+            self.logger.info(f"  ✓ Strategy succeeded (streamed): {best_strategy.__name__} ({len(best_results)} officials)")
+            officials.extend(r for r in best_results if r.name not in seen_names)
+            seen_names.update(attempt_names[best_strategy.__name__])
+        
+        return officials
+    
+    async def scrape_municipality_async(
+        self,
+        base_url: str,
+        municipality_name: Optional[str] = None,
+        prefecture: Optional[str] = None,
+        semaphore: Optional[asyncio.Semaphore] = None,
+    ) -> List[MunicipalOfficial]:
+        """
+        Async variant of scrape_municipality.
+        
+        Pages are fetched through the HTTP client off the event loop, so
+        robots.txt, the per-domain delay, caching, retries and encoding
+        detection match the sync path.
+        
+        Args:
+            base_url: Municipality website URL
+            municipality_name: Name of municipality
+            prefecture: Prefecture name
+            semaphore: Shared semaphore bounding in-flight requests
+            
+        Returns:
+            List of official records with detailed information
+        """
+        self.logger.info(f"🏛️  Scraping municipality: {municipality_name or base_url}")
+        # Local, since concurrent scrapes share this instance
+        timestamp = self._format_timestamp()
+        officials = []
+        
+        try:
+            # Step 1: Find official list pages
+            html = None
+            try:
+                html = await self._get_text_async(base_url, semaphore)
+                list_pages = self._find_list_pages_in_html(html, base_url) if html else []
+            except Exception as e:
+                self.logger.error(f"Error finding list pages: {e}")
+                list_pages = [base_url]
+            
+            if not list_pages:
+                self.logger.warning(f"⚠️  No official list pages found on {base_url}")
                 return []
             
-            # Try multiple extraction strategies
-            strategies = [
-                self._extract_from_table,
-                self._extract_from_list,
-                self._extract_from_cards,
-                self._extract_from_divs,
-            ]
+            self.logger.info(f"✓ Found {len(list_pages)} potential list pages")
             
-            for strategy in strategies:
-                try:
-                    results = strategy(soup, page_url, municipality_name, prefecture)
-                    if results and len(results) > 0:
-                        # Filter out navigation items
-                        valid_results = [r for r in results if self._is_valid_official(r)]
-                        if valid_results:
-                            self.logger.info(f"  ✓ Strategy succeeded: {strategy.__name__} ({len(valid_results)} officials)")
-                            officials.extend(valid_results)
-                            break  # Use first successful strategy
-                except Exception as e:
-                    self.logger.debug(f"  Strategy {strategy.__name__} failed: {e}")
+            # Step 2: Fetch the top pages (one at a time per host), then extract.
+            # The base page is usually the fallback list page, so reuse its body.
+            page_urls = list(dict.fromkeys(list_pages[:5]))
+            pages = await asyncio.gather(
+                *(
+                    self._get_text_async(url, semaphore)
+                    for url in page_urls if url != base_url
+                ),
+                return_exceptions=True,
+            )
+            fetched = iter(pages)
+            pages = [html if url == base_url else next(fetched) for url in page_urls]
+            seen_names: Set[str] = set()
+            
+            for page_url, html in zip(page_urls, pages):
+                if isinstance(html, Exception):
+                    self.logger.error(f"❌ Failed to extract from {page_url}: {html}")
+                    continue
+                if not html:
                     continue
+                
+                page_officials = self._extract_officials_from_html(
+                    html, page_url, municipality_name, prefecture, seen_names
+                )
+                if page_officials:
+                    self.logger.info(f"  → Found {len(page_officials)} officials")
+                    officials.extend(page_officials)
+            
+            for official in officials:
+                official.last_updated = timestamp
+            
+            # Step 3: Validate and clean data (names are deduplicated during extraction)
+            officials = self._validate_officials(officials)
+            
+            self.logger.info(f"✅ Extracted {len(officials)} officials from {municipality_name or base_url}")
             
         except Exception as e:
-            self.logger.error(f"Error extracting from page: {e}")
+            self.logger.error(f"❌ Error scraping {municipality_name or base_url}: {e}")
+            return []
         
         return officials
     
+    async def scrape_municipalities_async(
+        self,
+        targets: List[Tuple[str, Optional[str], Optional[str]]],
+        max_concurrent: int = 10,
+    ) -> List[List[MunicipalOfficial]]:
+        """
+        Scrape many municipalities concurrently on one event loop.
+        
+        Different hosts are fetched in parallel; requests to one host are
+        still spaced by the client's per-domain delay.
+        
+        Args:
+            targets: (base_url, municipality_name, prefecture) tuples
+            max_concurrent: Maximum number of in-flight requests
+            
+        Returns:
+            One list of officials per target, in input order
+        """
+        semaphore = asyncio.Semaphore(max_concurrent)
+        return await asyncio.gather(*(
+            self.scrape_municipality_async(url, name, pref, semaphore)
+            for url, name, pref in targets
+        ))
+    
     def _extract_from_table(
         self,
         soup: BeautifulSoup,
         page_url: str,
         municipality_name: Optional[str],
         prefecture: Optional[str],
-    ) -> List[Dict[str, Any]]:
+        seen: Optional[Set[str]] = None,
+    ) -> List[MunicipalOfficial]:
         """Extract from HTML table structure."""
         officials = []
         
@@ -258,7 +620,7 @@ class EnhancedMunicipalScraper(BaseScraper):
                 cells = row.find_all(['td', 'th'])
                 
                 if len(cells) >= 1:
-                    official = self._parse_official_data(cells, page_url, municipality_name, prefecture)
+                    official = self._parse_official_data(cells, page_url, municipality_name, prefecture, seen)
                     if official:
                         officials.append(official)
         
@@ -270,7 +632,8 @@ class EnhancedMunicipalScraper(BaseScraper):
         page_url: str,
         municipality_name: Optional[str],
         prefecture: Optional[str],
-    ) -> List[Dict[str, Any]]:
+        seen: Optional[Set[str]] = None,
+    ) -> List[MunicipalOfficial]:
         """Extract from list structure (ul/ol/li)."""
         officials = []
         
@@ -285,18 +648,16 @@ class EnhancedMunicipalScraper(BaseScraper):
                 
                 # Extract name
                 name = self._extract_name(text)
-                if name:
-                    official = {
-                        'name': name,
-                        'municipality': municipality_name or 'Unknown',
-                        'prefecture': prefecture or 'Unknown',
-                        'source_url': page_url,
-                        'extraction_method': 'list',
-                        'last_updated': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-                    }
-                    
-                    # Extract additional info
-                    official.update(self._extract_additional_info(item, text))
+                if name and self._is_new_name(name, seen):
+                    official = MunicipalOfficial(
+                        name=name,
+                        municipality=municipality_name or 'Unknown',
+                        prefecture=prefecture or 'Unknown',
+                        source_url=page_url,
+                        extraction_method='list',
+                        last_updated=self._scrape_timestamp,
+                        **self._extract_additional_info(item, text),
+                    )
                     
                     officials.append(official)
         
@@ -308,7 +669,8 @@ class EnhancedMunicipalScraper(BaseScraper):
         page_url: str,
         municipality_name: Optional[str],
         prefecture: Optional[str],
-    ) -> List[Dict[str, Any]]:
+        seen: Optional[Set[str]] = None,
+    ) -> List[MunicipalOfficial]:
         """Extract from card-based layouts."""
         officials = []
         
@@ -326,17 +688,16 @@ class EnhancedMunicipalScraper(BaseScraper):
                 text = card.get_text(separator=' ', strip=True)
                 name = self._extract_name(text)
                 
-                if name:
-                    official = {
-                        'name': name,
-                        'municipality': municipality_name or 'Unknown',
-                        'prefecture': prefecture or 'Unknown',
-                        'source_url': page_url,
-                        'extraction_method': 'card',
-                        'last_updated': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-                    }
-                    
-                    official.update(self._extract_additional_info(card, text))
+                if name and self._is_new_name(name, seen):
+                    official = MunicipalOfficial(
+                        name=name,
+                        municipality=municipality_name or 'Unknown',
+                        prefecture=prefecture or 'Unknown',
+                        source_url=page_url,
+                        extraction_method='card',
+                        last_updated=self._scrape_timestamp,
+                        **self._extract_additional_info(card, text),
+                    )
                     officials.append(official)
         
         return officials
@@ -347,28 +708,28 @@ class EnhancedMunicipalScraper(BaseScraper):
         page_url: str,
         municipality_name: Optional[str],
         prefecture: Optional[str],
-    ) -> List[Dict[str, Any]]:
+        seen: Optional[Set[str]] = None,
+    ) -> List[MunicipalOfficial]:
         """Extract from div-based layouts."""
         officials = []
         
         # Find divs that might contain official info
-        divs = soup.find_all('div', class_=re.compile(r'(member|official|profile|giin)', re.I))
+        divs = soup.find_all('div', class_=self.MEMBER_CLASS_RE)
         
         for div in divs:
             text = div.get_text(separator=' ', strip=True)
             name = self._extract_name(text)
             
-            if name:
-                official = {
-                    'name': name,
-                    'municipality': municipality_name or 'Unknown',
-                    'prefecture': prefecture or 'Unknown',
-                    'source_url': page_url,
-                    'extraction_method': 'div',
-                    'last_updated': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-                }
-                
-                official.update(self._extract_additional_info(div, text))
+            if name and self._is_new_name(name, seen):
+                official = MunicipalOfficial(
+                    name=name,
+                    municipality=municipality_name or 'Unknown',
+                    prefecture=prefecture or 'Unknown',
+                    source_url=page_url,
+                    extraction_method='div',
+                    last_updated=self._scrape_timestamp,
+                    **self._extract_additional_info(div, text),
+                )
                 officials.append(official)
         
         return officials
@@ -379,30 +740,29 @@ class EnhancedMunicipalScraper(BaseScraper):
         page_url: str,
         municipality_name: Optional[str],
         prefecture: Optional[str],
-    ) -> Optional[Dict[str, Any]]:
+        seen: Optional[Set[str]] = None,
+    ) -> Optional[MunicipalOfficial]:
         """Parse official data from table cells."""
         if not cells:
             return None
         
-        # Combine all cell text
-        full_text = ' '.join([cell.get_text(strip=True) for cell in cells])
-        
         # Extract name from first cell
         name = self._extract_name(cells[0].get_text(strip=True))
-        if not name:
+        if not name or not self._is_new_name(name, seen):
             return None
         
-        official = {
-            'name': name,
-            'municipality': municipality_name or 'Unknown',
-            'prefecture': prefecture or 'Unknown',
-            'source_url': page_url,
-            'extraction_method': 'table',
-            'last_updated': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-        }
+        # Combine all cell text
+        full_text = ' '.join([cell.get_text(strip=True) for cell in cells])
         
-        # Extract additional info from all cells
-        official.update(self._extract_additional_info(cells[0].parent, full_text))
+        official = MunicipalOfficial(
+            name=name,
+            municipality=municipality_name or 'Unknown',
+            prefecture=prefecture or 'Unknown',
+            source_url=page_url,
+            extraction_method='table',
+            last_updated=self._scrape_timestamp,
+            **self._extract_additional_info(cells[0].parent, full_text),
+        )
         
         return official
     
@@ -425,18 +785,12 @@ class EnhancedMunicipalScraper(BaseScraper):
     
     def _is_likely_name(self, text: str) -> bool:
         """Check if text is likely a person's name."""
-        # Exclude common non-name words
-        excluded_words = [
-            '議員', '市議', '区議', '町議', '村議', '県議', '都議', '府議', '道議',
-            '議長', '副議長', '委員長', '委員', '会長', '副会長',
-            '住民', '登録', '相談', '窓口', '受付', '案内', '情報', '一覧', '名簿',
-            '上下水道', '浄化槽', '除雪', '道路', '河川', '動物', 'ペット',
-            '墓地', '墓園', '消費', '生活', 'くらし', '住まい', '土地'
-        ]
-        
-        for excluded in excluded_words:
-            if excluded in text:
-                return False
+        # Exclude common non-name words; real names rarely share any of their
+        # characters, so the substring loop only runs on a sentinel hit
+        if not self.EXCLUDED_NAME_CHARS.isdisjoint(text):
+            for excluded in self.EXCLUDED_NAME_WORDS:
+                if excluded in text:
+                    return False
         
         # Name should be 2-8 characters
         if len(text) < 2 or len(text) > 8:
@@ -453,28 +807,19 @@ class EnhancedMunicipalScraper(BaseScraper):
         if party:
             info['party'] = party
         
-        # Extract age
-        age = self._extract_age(text)
-        if age:
-            info['age'] = age
-        
-        # Extract election count
-        elections = self._extract_election_count(text)
-        if elections:
-            info['election_count'] = elections
+        # Extract age, election count and region/constituency
+        info.update(self._extract_row_features(text))
         
-        # Extract region/constituency
-        region = self._extract_region(text)
-        if region:
-            info['region'] = region
+        # Collect the element's links once for both link-based extractors
+        anchors = element.find_all('a', href=True)
         
         # Extract social media
-        social = self._extract_social_media(element)
+        social = self._extract_social_media(anchors)
         if social:
             info.update(social)
         
         # Extract official website
-        website = self._extract_official_website(element)
+        website = self._extract_official_website(anchors)
         if website:
             info['official_website'] = website
         
@@ -482,96 +827,64 @@ class EnhancedMunicipalScraper(BaseScraper):
     
     def _extract_party(self, text: str) -> Optional[str]:
         """Extract political party from text."""
-        for party in self.PARTY_KEYWORDS:
-            if party in text:
-                return party
-        return None
+        return min(
+            (match.group(1) for match in self.PARTY_KEYWORD_RE.finditer(text)),
+            key=self.PARTY_PRIORITY.__getitem__,
+            default=None,
+        )
     
-    def _extract_age(self, text: str) -> Optional[int]:
-        """Extract age from text."""
-        for pattern in self.AGE_PATTERNS:
-            match = re.search(pattern, text)
-            if match:
-                try:
-                    if '歳' in pattern:
-                        return int(match.group(1))
-                    elif '年齢' in pattern:
-                        return int(match.group(1))
-                    # Handle birth dates if needed
-                except:
-                    continue
-        return None
+    def _extract_row_features(self, text: str) -> Dict[str, Any]:
+        """Extract age, election count and region from one scan of the text."""
+        hits: Dict[str, str] = {}
+        for match in self.COMBINED_INFO_RE.finditer(text):
+            hits.setdefault(match.lastgroup, match.group(match.lastgroup))
+        
+        features: Dict[str, Any] = {}
+        for feature, groups in self.INFO_GROUPS.items():
+            value = next((hits[group] for group in groups if group in hits), None)
+            if value and feature != 'region':
+                value = int(value)
+            if value:
+                features[feature] = value
+        
+        return features
     
-    def _extract_election_count(self, text: str) -> Optional[int]:
-        """Extract number of times elected."""
-        for pattern in self.ELECTION_PATTERNS:
-            match = re.search(pattern, text)
-            if match:
-                try:
-                    return int(match.group(1))
-                except:
-                    continue
-        return None
-    
-    def _extract_region(self, text: str) -> Optional[str]:
-        """Extract electoral district/region."""
-        # Common region patterns
-        region_patterns = [
-            r'([1-9]区)',  # 1区, 2区
-            r'([東西南北中][部区])',  # 東部, 西区
-            r'([あ-ん]{2,5}区)',  # ひらがな区名
-        ]
-        
-        for pattern in region_patterns:
-            match = re.search(pattern, text)
-            if match:
-                return match.group(1)
-        
-        return None
-    
-    def _extract_social_media(self, element: Tag) -> Dict[str, str]:
-        """Extract social media URLs."""
+    def _extract_social_media(self, anchors: List[Tag]) -> Dict[str, str]:
+        """Extract social media URLs from an element's <a href> tags."""
         social = {}
         
-        # Find all links in element
-        links = element.find_all('a', href=True)
-        
-        for link in links:
+        for link in anchors:
             href = link.get('href', '')
             
-            for platform, patterns in self.SOCIAL_PATTERNS.items():
-                for pattern in patterns:
-                    match = re.search(pattern, href, re.I)
-                    if match:
-                        if platform == 'youtube':
-                            social['youtube'] = f"https://youtube.com/{match.group(2)}"
-                        else:
-                            social[platform] = href
-                        break
+            for platform, pattern in self.SOCIAL_RE.items():
+                match = pattern.search(href)
+                if match:
+                    if platform == 'youtube':
+                        social['youtube'] = f"https://youtube.com/{match.group(1)}"
+                    else:
+                        social[platform] = href
         
         return social
     
-    def _extract_official_website(self, element: Tag) -> Optional[str]:
-        """Extract official website URL."""
-        links = element.find_all('a', href=True)
-        
-        for link in links:
+    def _extract_official_website(self, anchors: List[Tag]) -> Optional[str]:
+        """Extract official website URL from an element's <a href> tags."""
+        for link in anchors:
             text = link.get_text(strip=True)
             href = link.get('href', '')
             
             # Look for keywords indicating official site
-            if any(keyword in text for keyword in ['公式', 'ホームページ', 'HP', 'Website', 'Official']):
+            if self.WEBSITE_KEYWORD_RE.search(text):
                 return href
             
             # Check if it's an external personal site
-            if href.startswith('http') and not any(x in href for x in ['twitter', 'facebook', 'instagram', 'youtube']):
+            if href.startswith('http') and not self.SOCIAL_HOST_RE.search(href):
                 return href
         
         return None
     
-    def _is_valid_official(self, official: Dict[str, Any]) -> bool:
+    def _is_valid_official(self, official: MunicipalOfficial) -> bool:
         """Validate that extracted data is actually an official."""
-        name = official.get('name', '')
+        name = official.name
         
         # Must have a name
         if not name or len(name) < 2:
@@ -583,47 +896,15 @@ class EnhancedMunicipalScraper(BaseScraper):
         
         return True
     
-    def _deduplicate_officials(self, officials: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-        """Remove duplicate officials by name."""
-        seen_names = set()
-        unique_officials = []
-        
-        for official in officials:
-            name = official.get('name', '')
-            if name and name not in seen_names:
-                seen_names.add(name)
-                unique_officials.append(official)
-        
-        return unique_officials
-    
-    def _validate_officials(self, officials: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-        """Final validation and cleanup of official data."""
-        validated = []
-        
-        for official in officials:
-            # Ensure required fields
-            if not official.get('name'):
-                continue
-            
-            # Set defaults for missing fields
-            official.setdefault('party', '')
-            official.setdefault('age', '')
-            official.setdefault('region', '')
-            official.setdefault('election_count', '')
-            official.setdefault('twitter', '')
-            official.setdefault('facebook', '')
-            official.setdefault('instagram', '')
-            official.setdefault('official_website', '')
-            
-            validated.append(official)
-        
-        return validated
-    
-    def _is_same_domain(self, url1: str, url2: str) -> bool:
-        """Check if two URLs are from the same domain."""
-        try:
-            domain1 = urlparse(url1).netloc
-            domain2 = urlparse(url2).netloc
-            return domain1 == domain2 or domain2.endswith(domain1) or domain1.endswith(domain2)
-        except:
+    def _is_new_name(self, name: str, seen: Optional[Set[str]]) -> bool:
+        """Record name in seen, returning False if it was already there."""
+        if seen is None:
+            return True
+        if name in seen:
             return False
+        seen.add(name)
+        return True
+    
+    def _validate_officials(self, officials: List[MunicipalOfficial]) -> List[MunicipalOfficial]:
+        """Final validation of official data (field defaults live on MunicipalOfficial)."""
+        return [official for official in officials if official.name]
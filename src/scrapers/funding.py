@@ -4,8 +4,14 @@ Sources: SOUMU political funds disclosure, prefectural portals.
 """
 
 from typing import List, Dict, Any, Optional
+import codecs
+import itertools
 import re
 
+from bs4 import SoupStrainer
+from lxml import etree
+from requests.compat import chardet
+
 from .base import BaseScraper
 from ..utils.parsers import (
     parse_html,
@@ -15,11 +21,40 @@ from ..utils.parsers import (
     normalize_url,
 )
 from ..core.config import load_sources
+from ..core.http_client import detect_shift_jis
 
 
 class FundingScraper(BaseScraper):
     """Scraper for political funding reports."""
     
+    # Link-text keywords that indicate funding reports
+    REPORT_KEYWORDS = (
+        '収支報告', '政治資金', '資金報告', '収支',
+        'funding', 'report', 'finance', 'disclosure',
+    )
+    
+    # Report years: 令和X年 (Reiwa X) or a Western 20XX year
+    REIWA_YEAR_RE = re.compile(r'令和(\d+)年')
+    WESTERN_YEAR_RE = re.compile(r'(20\d{2})')
+    
+    # Report totals, e.g. 収入合計：12,345,678円
+    INCOME_TOTAL_RE = re.compile(r'収入[合計総額：\s]+([0-9,]+)')
+    EXPENSE_TOTAL_RE = re.compile(r'支出[合計総額：\s]+([0-9,]+)')
+    
+    # Report pages are streamed and abandoned once both totals are seen
+    STREAM_CHUNK_SIZE = 16384
+    STREAM_OVERLAP = 2048
+    TAG_RE = re.compile(r'<[^>]*>')
+    
+    # A table cell holding only an amount, e.g. "12,345,678円"
+    CELL_AMOUNT_RE = re.compile(r'^\s*([\d,]*\d[\d,]*)\s*円?\s*$')
+    
+    # Report links are the only part of a funding page read through BeautifulSoup
+    REPORT_LINK_STRAINER = SoupStrainer('a', href=True)
+    
+    # Text is already decoded, so the declared page charset must be ignored
+    _HTML_PARSER = etree.HTMLParser(encoding='utf-8')
+    
     def __init__(self, *args, **kwargs):
         """Initialize funding scraper."""
         super().__init__(*args, **kwargs)
@@ -55,13 +90,15 @@ class FundingScraper(BaseScraper):
         if limit:
             urls = urls[:limit]
         
-        for idx, url in enumerate(urls, 1):
+        # Fetch all pages concurrently, then parse each one
+        pages = self.fetch_pages(urls)
+        
+        for idx, (url, html) in enumerate(zip(urls, pages), 1):
             try:
                 self.logger.info(f"Scraping {idx}/{len(urls)}: {url}")
-                funding_records = self._scrape_funding_page(url)
+                funding_records = self._parse_funding_page(url, html) if html else []
                 
-                for record in funding_records:
-                    self.add_result(record)
+                self.add_results(funding_records)
                 
                 self.log_progress(idx, len(urls), "sources")
                 
@@ -104,14 +141,32 @@ class FundingScraper(BaseScraper):
         Returns:
             List of funding records
         """
-        records = []
-        
         try:
             response = self.http.get(url)
             if not response:
-                return records
+                return []
             
-            soup = parse_html(response.text)
+            return self._parse_funding_page(url, response.text)
+            
+        except Exception as e:
+            self.logger.error(f"Error parsing funding from {url}: {e}")
+            return []
+    
+    def _parse_funding_page(self, url: str, html: str) -> List[Dict[str, Any]]:
+        """
+        Extract funding records from an already fetched page.
+        
+        Args:
+            url: Page URL
+            html: Page HTML
+            
+        Returns:
+            List of funding records
+        """
+        records = []
+        
+        try:
+            soup = parse_html(html, parse_only=self.REPORT_LINK_STRAINER)
             
             # Strategy 1: Find PDF/report links
             report_links = self._find_report_links(soup, url)
@@ -140,11 +195,12 @@ class FundingScraper(BaseScraper):
                     
                     records.append(record)
             
-            # Strategy 2: Parse tables with funding data
-            tables = soup.find_all('table')
-            for table in tables:
-                table_records = self._parse_funding_table(table, url)
-                records.extend(table_records)
+            # Strategy 2: Parse tables with funding data (walked with lxml xpath)
+            root = etree.fromstring(html.encode('utf-8'), self._HTML_PARSER)
+            if root is not None:
+                for table in root.iter('table'):
+                    table_records = self._parse_funding_table(table, url)
+                    records.extend(table_records)
             
         except Exception as e:
             self.logger.error(f"Error parsing funding from {url}: {e}")
@@ -164,18 +220,12 @@ class FundingScraper(BaseScraper):
         """
         links = []
         
-        # Keywords that indicate funding reports
-        keywords = [
-            '収支報告', '政治資金', '資金報告', '収支',
-            'funding', 'report', 'finance', 'disclosure'
-        ]
-        
         for a_tag in soup.find_all('a', href=True):
             link_text = extract_text(a_tag).lower()
             href = a_tag['href']
             
             # Check if link text contains keywords
-            if any(kw in link_text for kw in keywords):
+            if any(kw in link_text for kw in self.REPORT_KEYWORDS):
                 full_url = normalize_url(href, base_url)
                 
                 links.append({
@@ -217,13 +267,13 @@ class FundingScraper(BaseScraper):
     def _extract_year(self, text: str) -> Optional[int]:
         """Extract year from text."""
         # Pattern for Japanese year (令和X年 -> Reiwa X)
-        reiwa_match = re.search(r'令和(\d+)年', text)
+        reiwa_match = self.REIWA_YEAR_RE.search(text)
         if reiwa_match:
             reiwa_year = int(reiwa_match.group(1))
             return 2018 + reiwa_year  # Reiwa 1 = 2019
         
         # Pattern for Western year
-        year_match = re.search(r'(20\d{2})', text)
+        year_match = self.WESTERN_YEAR_RE.search(text)
         if year_match:
             return int(year_match.group(1))
         
@@ -251,21 +301,23 @@ class FundingScraper(BaseScraper):
                 self.logger.debug(f"Skipping PDF parsing: {url}")
                 return totals
             
-            response = self.http.get_safe(url)
+            response = self.http.get_safe(url, stream=True)
             if not response:
                 return totals
             
-            soup = parse_html(response.text)
-            page_text = soup.get_text()
+            try:
+                page_text = self._html_to_text(self._read_until_totals(response))
+            finally:
+                response.close()
             
             # Look for total amounts
             # Pattern: 収入合計：12,345,678円
-            income_match = re.search(r'収入[合計総額：\s]+([0-9,]+)', page_text)
+            income_match = self.INCOME_TOTAL_RE.search(page_text)
             if income_match:
                 amount_str = income_match.group(1).replace(',', '')
                 totals['income_total'] = float(amount_str)
             
-            expense_match = re.search(r'支出[合計総額：\s]+([0-9,]+)', page_text)
+            expense_match = self.EXPENSE_TOTAL_RE.search(page_text)
             if expense_match:
                 amount_str = expense_match.group(1).replace(',', '')
                 totals['expense_total'] = float(amount_str)
@@ -279,12 +331,96 @@ class FundingScraper(BaseScraper):
         
         return totals
     
+    def _read_until_totals(self, response) -> str:
+        """
+        Read a streamed report page only as far as both totals.
+        
+        Totals usually sit in a summary near the top of the page, so the rest
+        of the body is not downloaded once both have appeared in full (not
+        cut off at the end of what has been read so far). The check runs on
+        a tag-stripped window that overlaps the previous chunk, so matches
+        spanning a chunk boundary are still seen.
+        
+        Args:
+            response: Response fetched with stream=True
+            
+        Returns:
+            Decoded HTML read so far
+        """
+        chunks = response.iter_content(chunk_size=self.STREAM_CHUNK_SIZE)
+        first = b''
+        for chunk in chunks:
+            first += chunk
+            if len(first) >= 500:
+                break
+        
+        # Same detection as HTTPClient, on the start of the body. Without a
+        # charset in the header requests assumes ISO-8859-1, so the
+        # detected encoding is used instead. The sample ends at a '>', which
+        # is never part of a multi-byte character: detection gives up on a
+        # character cut off by the chunk boundary.
+        sample = first[:first.rfind(b'>') + 1] or first
+        apparent = chardet.detect(sample)['encoding'] if chardet else None
+        encoding = detect_shift_jis(first, apparent)
+        if encoding is None:
+            has_charset = 'charset' in response.headers.get('content-type', '').lower()
+            encoding = response.encoding if has_charset else apparent
+        decoder = codecs.getincrementaldecoder(encoding or 'utf-8')(errors='replace')
+        
+        parts: List[str] = []
+        tail = ''
+        found = {self.INCOME_TOTAL_RE: False, self.EXPENSE_TOTAL_RE: False}
+        
+        for chunk in itertools.chain([first], chunks):
+            text = decoder.decode(chunk)
+            parts.append(text)
+            
+            window = tail + text
+            # A tag cut off by the chunk boundary could be hiding more digits
+            cut = window.rfind('<')
+            if cut > window.rfind('>'):
+                window = window[:cut]
+            window = self.TAG_RE.sub('', window)
+            for pattern in found:
+                if not found[pattern]:
+                    match = pattern.search(window)
+                    found[pattern] = bool(match) and match.end() < len(window)
+            if all(found.values()):
+                break
+            
+            tail = (tail + text)[-self.STREAM_OVERLAP:]
+        else:
+            parts.append(decoder.decode(b'', final=True))
+        
+        return ''.join(parts)
+    
+    def _html_to_text(self, html: str) -> str:
+        """
+        Flatten an HTML page to its text without building a BeautifulSoup tree.
+        
+        Report pages are only grepped for totals, so the lxml tree is walked
+        once for its text and dropped. Script and style contents are skipped,
+        matching BeautifulSoup's get_text().
+        
+        Args:
+            html: Page HTML
+            
+        Returns:
+            Concatenated text content
+        """
+        root = etree.fromstring(html.encode('utf-8'), self._HTML_PARSER)
+        if root is None:
+            return ''
+        
+        etree.strip_elements(root, 'script', 'style', with_tail=False)
+        return ''.join(root.itertext())
+    
     def _parse_funding_table(self, table, source_url: str) -> List[Dict[str, Any]]:
         """
         Parse funding data from table.
         
         Args:
-            table: BeautifulSoup table element
+            table: lxml table element
             source_url: Source page URL
             
         Returns:
@@ -292,16 +428,17 @@ class FundingScraper(BaseScraper):
         """
         records = []
         
-        rows = table.find_all('tr')
+        rows = table.xpath('.//tr')
         if len(rows) < 2:
             return records
         
         for row in rows[1:]:  # Skip header
-            cells = row.find_all(['td', 'th'])
+            cells = row.xpath('.//td | .//th')
             if len(cells) < 2:
                 continue
             
-            cell_texts = [extract_text(cell) for cell in cells]
+            # Whitespace-normalized like extract_text
+            cell_texts = [' '.join(''.join(cell.itertext()).split()) for cell in cells]
             
             # Try to extract year and amounts
             year = None
@@ -314,13 +451,17 @@ class FundingScraper(BaseScraper):
                     year = self._extract_year(text)
                 
                 # Look for amounts (numbers with commas)
-                amount_str = text.replace(',', '').replace('円', '').strip()
-                if amount_str.isdigit():
-                    amount = float(amount_str)
+                amount_match = self.CELL_AMOUNT_RE.match(text)
+                if amount_match:
+                    amount = float(amount_match.group(1).replace(',', ''))
                     if income is None:
                         income = amount
                     elif expense is None:
                         expense = amount
+                
+                # Later cells cannot change anything once all three are set
+                if year and expense is not None:
+                    break
             
             if year or income or expense:
                 record = {
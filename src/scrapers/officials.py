@@ -3,8 +3,11 @@ Officials scraper - extracts public official information from websites.
 Collects: name, age, faction, promises, blog, SNS links.
 """
 
-from typing import List, Dict, Any, Optional
+import re
+from typing import List, Dict, Any, Optional, Tuple
 from datetime import datetime
+import soupsieve
+from bs4 import Tag
 
 from .base import BaseScraper
 from ..utils.parsers import (
@@ -21,6 +24,59 @@ from ..core.config import load_sources
 class OfficialsScraper(BaseScraper):
     """Scraper for public official information."""
     
+    # Name selectors in priority order, compiled once
+    NAME_SELECTORS = (
+        'h1.name',
+        'h1',
+        '.profile-name',
+        '.name',
+        'meta[property="og:title"]',
+    )
+    NAME_SELECTOR = soupsieve.compile(', '.join(NAME_SELECTORS))
+    NAME_SELECTOR_PARTS = tuple(soupsieve.compile(selector) for selector in NAME_SELECTORS)
+    NAME_KANA_SELECTORS = ('.name-kana', '.kana', 'ruby rt')
+    
+    # Link/heading keywords, in priority order; each list also has one
+    # case-insensitive alternation so a text is scanned once, not per keyword
+    FACTION_KEYWORDS = ('政党', '会派', '所属', '党', 'party', 'faction')
+    FACTION_RE = re.compile('|'.join(map(re.escape, FACTION_KEYWORDS)), re.I)
+    PROMISE_KEYWORDS = ('公約', 'マニフェスト', '政策', 'pledge', 'manifesto', 'policy')
+    PROMISE_RE = re.compile('|'.join(map(re.escape, PROMISE_KEYWORDS)), re.I)
+    BLOG_KEYWORDS = ('ブログ', 'blog', '日記', 'diary')
+    BLOG_RE = re.compile('|'.join(map(re.escape, BLOG_KEYWORDS)), re.I)
+    LINK_KEYWORD_RE = {'promises_url': PROMISE_RE, 'blog_url': BLOG_RE}
+    
+    # Keywords for each office level, highest priority first. re.I covers the
+    # English tokens without lowercasing the whole page.
+    OFFICE_TYPE_RE = {
+        'national': re.compile(r'衆議院|参議院|国会議員|house of representatives|diet', re.I),
+        'prefectural': re.compile(r'都議|道議|府議|県議|prefectural', re.I),
+        'municipal': re.compile(r'市議|区議|町議|村議|municipal|city council', re.I),
+    }
+    
+    # Prefecture names for jurisdiction lookup, in priority order. The lookahead
+    # alternation finds every (overlapping) occurrence in a single pass.
+    PREFECTURES = (
+        '北海道', '青森', '岩手', '宮城', '秋田', '山形', '福島',
+        '茨城', '栃木', '群馬', '埼玉', '千葉', '東京', '神奈川',
+        '新潟', '富山', '石川', '福井', '山梨', '長野', '岐阜',
+        '静岡', '愛知', '三重', '滋賀', '京都', '大阪', '兵庫',
+        '奈良', '和歌山', '鳥取', '島根', '岡山', '広島', '山口',
+        '徳島', '香川', '愛媛', '高知', '福岡', '佐賀', '長崎',
+        '熊本', '大分', '宮崎', '鹿児島', '沖縄',
+    )
+    PREFECTURE_RE = re.compile('(?=(' + '|'.join(PREFECTURES) + '))')
+    PREFECTURE_RANK = {name: rank for rank, name in enumerate(PREFECTURES)}
+    
+    # SNS handles, captured in a group named after the platform. The lookahead
+    # lets matches overlap, so one platform's URL never hides another's.
+    SNS_HANDLE_RE = re.compile(
+        r'(?=(?:twitter\.com|x\.com)/(?P<x>[a-zA-Z0-9_]+)'
+        r'|instagram\.com/(?P<instagram>[a-zA-Z0-9_.]+)'
+        r'|(?:facebook\.com|fb\.com)/(?P<facebook>[a-zA-Z0-9.]+)'
+        r'|youtube\.com/(?:channel/|@|c/)(?P<youtube>[a-zA-Z0-9_-]+))'
+    )
+    
     def __init__(self, *args, **kwargs):
         """Initialize officials scraper."""
         super().__init__(*args, **kwargs)
@@ -58,11 +114,13 @@ class OfficialsScraper(BaseScraper):
         if limit:
             urls = urls[:limit]
         
-        # Scrape each URL
-        for idx, url in enumerate(urls, 1):
+        # Fetch all pages concurrently, then parse each one
+        pages = self.fetch_pages(urls)
+        
+        for idx, (url, html) in enumerate(zip(urls, pages), 1):
             try:
                 self.logger.info(f"Scraping {idx}/{len(urls)}: {url}")
-                official_data = self._scrape_official_page(url)
+                official_data = self._parse_official_page(url, html) if html else None
                 
                 if official_data:
                     self.add_result(official_data)
@@ -113,27 +171,52 @@ class OfficialsScraper(BaseScraper):
             if not response:
                 return None
             
-            soup = parse_html(response.text)
+            return self._parse_official_page(url, response.text)
+            
+        except Exception as e:
+            self.logger.error(f"Error scraping {url}: {e}")
+            return None
+    
+    def _parse_official_page(self, url: str, html: str) -> Optional[Dict[str, Any]]:
+        """
+        Extract official data from an already fetched page.
+        
+        Args:
+            url: Official website URL
+            html: Page HTML
+            
+        Returns:
+            Official data dict or None
+        """
+        try:
+            soup = parse_html(html)
+            
+            # Walk the tree once; the extractors share the text and links
+            page_text = soup.get_text()
+            link_tags = soup.find_all('a', href=True)
+            anchors = [(extract_text(a_tag), a_tag) for a_tag in link_tags]
+            
+            link_urls = self._find_link_urls(anchors, url)
             
             # Extract data
             official_data = {
                 'official_id': self.generate_id(url),
                 'name': self._extract_name(soup, url),
                 'name_kana': self._extract_name_kana(soup),
-                'age': self._extract_age(soup),
+                'age': self._extract_age(page_text),
                 'faction': self._extract_faction(soup),
-                'office_type': self._infer_office_type(soup, url),
-                'jurisdiction': self._extract_jurisdiction(soup),
+                'office_type': self._infer_office_type(page_text, url),
+                'jurisdiction': self._extract_jurisdiction(page_text),
                 'promises_text': self._extract_promises(soup),
-                'promises_url': self._find_promises_url(soup, url),
+                'promises_url': link_urls['promises_url'],
                 'website_url': url,
-                'blog_url': self._find_blog_url(soup, url),
+                'blog_url': link_urls['blog_url'],
                 'source_url': url,
                 'last_updated': self.get_timestamp(),
             }
             
             # Also collect SNS data separately
-            sns_data = self._extract_sns_links(soup, official_data['official_id'])
+            sns_data = self._extract_sns_links(soup, official_data['official_id'], link_tags)
             if sns_data:
                 # Store SNS data for later export
                 if not hasattr(self, 'sns_results'):
@@ -150,24 +233,18 @@ class OfficialsScraper(BaseScraper):
         """Extract official name."""
         # Try multiple strategies
         
-        # 1. Look for common name selectors
-        selectors = [
-            'h1.name',
-            'h1',
-            '.profile-name',
-            '.name',
-            'meta[property="og:title"]',
-        ]
+        # 1. Look for common name selectors. One walk collects every candidate;
+        # the first candidate per selector is then taken in priority order.
+        candidates = self.NAME_SELECTOR.select(soup)
         
-        for selector in selectors:
-            if selector.startswith('meta'):
-                element = soup.select_one(selector)
+        for selector_text, selector in zip(self.NAME_SELECTORS, self.NAME_SELECTOR_PARTS):
+            element = next((c for c in candidates if selector.match(c)), None)
+            if selector_text.startswith('meta'):
                 if element:
                     name = element.get('content', '')
                     if name:
                         return clean_text(name)
             else:
-                element = soup.select_one(selector)
                 if element:
                     name = extract_text(element)
                     if name and len(name) < 50:  # Sanity check
@@ -187,34 +264,34 @@ class OfficialsScraper(BaseScraper):
     
     def _extract_name_kana(self, soup) -> Optional[str]:
         """Extract phonetic name (furigana)."""
-        selectors = ['.name-kana', '.kana', 'ruby rt']
-        
-        for selector in selectors:
+        for selector in self.NAME_KANA_SELECTORS:
             element = soup.select_one(selector)
             if element:
                 return clean_text(extract_text(element))
         
         return None
     
-    def _extract_age(self, soup) -> Optional[int]:
-        """Extract age from page."""
-        # Get all text and search for age patterns
-        page_text = soup.get_text()
+    def _extract_age(self, page_text: str) -> Optional[int]:
+        """Extract age from the page text."""
         return extract_age_from_text(page_text)
     
     def _extract_faction(self, soup) -> Optional[str]:
         """Extract political faction/party."""
-        # Common patterns for party/faction
-        keywords = ['政党', '会派', '所属', '党', 'party', 'faction']
+        # Collect every text node mentioning any keyword in one pass; each node
+        # is lowercased and its parent flattened at most once across keywords
+        candidates = [(t, t.lower()) for t in soup.find_all(string=self.FACTION_RE)]
+        parent_texts: Dict[int, str] = {}
         
-        for keyword in keywords:
+        for keyword in self.FACTION_KEYWORDS:
             # Look for elements containing keyword
-            elements = soup.find_all(text=lambda t: t and keyword in t.lower())
+            elements = [t for t, lowered in candidates if keyword in lowered]
             
             for element in elements:
                 parent = element.parent
                 if parent:
-                    text = extract_text(parent)
+                    text = parent_texts.get(id(parent))
+                    if text is None:
+                        text = parent_texts[id(parent)] = extract_text(parent)
                     # Extract faction name (usually after the keyword)
                     parts = text.split(keyword)
                     if len(parts) > 1:
@@ -224,49 +301,31 @@ class OfficialsScraper(BaseScraper):
         
         return None
     
-    def _infer_office_type(self, soup, url: str) -> Optional[str]:
-        """Infer office type (national/prefectural/municipal)."""
-        page_text = soup.get_text().lower()
-        
-        # Keywords for each level
-        if any(kw in page_text for kw in ['衆議院', '参議院', '国会議員', 'house of representatives', 'diet']):
-            return 'national'
-        elif any(kw in page_text for kw in ['都議', '道議', '府議', '県議', 'prefectural']):
-            return 'prefectural'
-        elif any(kw in page_text for kw in ['市議', '区議', '町議', '村議', 'municipal', 'city council']):
-            return 'municipal'
+    def _infer_office_type(self, page_text: str, url: str) -> Optional[str]:
+        """Infer office type (national/prefectural/municipal) from page text."""
+        # Levels are checked in priority order
+        for office_type, pattern in self.OFFICE_TYPE_RE.items():
+            if pattern.search(page_text):
+                return office_type
         
         return None
     
-    def _extract_jurisdiction(self, soup) -> Optional[str]:
+    def _extract_jurisdiction(self, page_text: str) -> Optional[str]:
         """Extract geographic jurisdiction."""
-        # Look for prefecture/city names
-        prefectures = [
-            '北海道', '青森', '岩手', '宮城', '秋田', '山形', '福島',
-            '茨城', '栃木', '群馬', '埼玉', '千葉', '東京', '神奈川',
-            '新潟', '富山', '石川', '福井', '山梨', '長野', '岐阜',
-            '静岡', '愛知', '三重', '滋賀', '京都', '大阪', '兵庫',
-            '奈良', '和歌山', '鳥取', '島根', '岡山', '広島', '山口',
-            '徳島', '香川', '愛媛', '高知', '福岡', '佐賀', '長崎',
-            '熊本', '大分', '宮崎', '鹿児島', '沖縄'
-        ]
-        
-        page_text = soup.get_text()
-        
-        for pref in prefectures:
-            if pref in page_text:
-                return pref
-        
-        return None
+        # Earlier prefectures in the list win, wherever they appear in the text
+        hits = {m.group(1) for m in self.PREFECTURE_RE.finditer(page_text)}
+        if not hits:
+            return None
+        return min(hits, key=self.PREFECTURE_RANK.__getitem__)
     
     def _extract_promises(self, soup) -> Optional[str]:
         """Extract campaign promises text."""
         # Look for promises/manifesto sections
-        keywords = ['公約', 'マニフェスト', '政策', 'pledge', 'manifesto', 'policy']
+        candidates = soup.find_all(['h2', 'h3', 'h4'], string=self.PROMISE_RE)
         
-        for keyword in keywords:
+        for keyword in self.PROMISE_KEYWORDS:
             # Find headings with keyword
-            headings = soup.find_all(['h2', 'h3', 'h4'], text=lambda t: t and keyword in t)
+            headings = [h for h in candidates if keyword in h.string]
             
             for heading in headings:
                 # Get following content
@@ -284,44 +343,47 @@ class OfficialsScraper(BaseScraper):
         
         return None
     
-    def _find_promises_url(self, soup, base_url: str) -> Optional[str]:
-        """Find link to promises/manifesto page."""
-        keywords = ['公約', 'マニフェスト', '政策', 'pledge', 'manifesto', 'policy']
+    def _find_link_urls(self, anchors: List[Tuple[str, Tag]], base_url: str) -> Dict[str, Optional[str]]:
+        """
+        Find the promises/manifesto and blog links in one pass.
         
-        for a_tag in soup.find_all('a', href=True):
-            link_text = extract_text(a_tag).lower()
-            href = a_tag['href']
+        Args:
+            anchors: (link text, <a>) pairs for the page
+            base_url: Base URL for resolving relatives
             
-            if any(kw in link_text for kw in keywords):
-                return normalize_url(href, base_url)
-        
-        return None
-    
-    def _find_blog_url(self, soup, base_url: str) -> Optional[str]:
-        """Find blog URL."""
-        keywords = ['ブログ', 'blog', '日記', 'diary']
+        Returns:
+            Dict with promises_url and blog_url (None if not found)
+        """
+        found: Dict[str, Optional[str]] = dict.fromkeys(self.LINK_KEYWORD_RE)
         
-        for a_tag in soup.find_all('a', href=True):
-            link_text = extract_text(a_tag).lower()
-            href = a_tag['href']
+        for link_text, a_tag in anchors:
+            for field, pattern in self.LINK_KEYWORD_RE.items():
+                if found[field] is None and pattern.search(link_text):
+                    found[field] = normalize_url(a_tag['href'], base_url)
             
-            if any(kw in link_text for kw in keywords):
-                return normalize_url(href, base_url)
+            if all(url is not None for url in found.values()):
+                break
         
-        return None
+        return found
     
-    def _extract_sns_links(self, soup, official_id: str) -> List[Dict[str, Any]]:
+    def _extract_sns_links(
+        self,
+        soup,
+        official_id: str,
+        anchors: Optional[List[Tag]] = None,
+    ) -> List[Dict[str, Any]]:
         """
         Extract SNS profile links.
         
         Args:
             soup: BeautifulSoup object
             official_id: Official ID to link to
+            anchors: Page's <a href> tags, if already collected
             
         Returns:
             List of SNS link records
         """
-        sns_links = find_sns_links(soup, self.sns_patterns)
+        sns_links = find_sns_links(soup, self.sns_patterns, anchors)
         
         records = []
         for platform, urls in sns_links.items():
@@ -344,20 +406,9 @@ class OfficialsScraper(BaseScraper):
     
     def _extract_handle_from_url(self, url: str, platform: str) -> Optional[str]:
         """Extract username/handle from SNS URL."""
-        import re
-        
-        patterns = {
-            'x': r'(?:twitter\.com|x\.com)/([a-zA-Z0-9_]+)',
-            'instagram': r'instagram\.com/([a-zA-Z0-9_.]+)',
-            'facebook': r'(?:facebook\.com|fb\.com)/([a-zA-Z0-9.]+)',
-            'youtube': r'youtube\.com/(?:channel/|@|c/)([a-zA-Z0-9_-]+)',
-        }
-        
-        pattern = patterns.get(platform)
-        if pattern:
-            match = re.search(pattern, url)
-            if match:
-                return match.group(1)
+        for match in self.SNS_HANDLE_RE.finditer(url):
+            if match.lastgroup == platform:
+                return match.group(platform)
         
         return None
     
@@ -4,19 +4,22 @@ Automatically detects and extracts official lists from diverse HTML structures.
 """
 
 from typing import List, Dict, Any, Optional, Set
+from collections import deque
 from datetime import datetime
+from itertools import islice
 import re
 from urllib.parse import urljoin, urlparse
 
-from bs4 import BeautifulSoup, Tag
+from lxml import etree
 
 from .base import BaseScraper
 from ..utils.parsers import (
-    parse_html,
+    parse_html_fast,
     extract_text,
     clean_text,
     normalize_url,
 )
+from ..utils.name_matching import normalize_name
 
 
 class SmartMunicipalScraper(BaseScraper):
@@ -34,6 +37,23 @@ class SmartMunicipalScraper(BaseScraper):
         '知事', '副知事',
         'member', 'council', 'assembly', 'legislator'
     ]
+    # One pass over (lowercased) text instead of a substring test per keyword
+    LIST_PAGE_KEYWORD_RE = re.compile(
+        '|'.join(re.escape(keyword.lower()) for keyword in LIST_PAGE_KEYWORDS)
+    )
+    LIST_PAGE_KEYWORD_MAX_LEN = max(len(keyword.lower()) for keyword in LIST_PAGE_KEYWORDS)
+    
+    # Hrefs never worth crawling for a list page: non-HTTP schemes,
+    # same-page anchors and document/image downloads
+    SKIP_LINK_RE = re.compile(
+        r'^\s*(?:mailto:|tel:|javascript:|#)'
+        r'|\.(?:pdf|jpe?g|png|gif|zip|docx?|xlsx?)(?:[?#]|\s*$)',
+        re.I,
+    )
+    
+    # Cell text that marks a party/faction column
+    PARTY_TOKENS = ('党', '会派', '無所属')
+    PARTY_RE = re.compile('|'.join(PARTY_TOKENS))
     
     # HTML patterns that indicate official data
     OFFICIAL_NAME_PATTERNS = [
@@ -41,11 +61,23 @@ class SmartMunicipalScraper(BaseScraper):
         r'[ぁ-ん]{2,}',  # Hiragana
         r'[ァ-ヴ]{2,}',  # Katakana
     ]
+    OFFICIAL_NAME_RES = [re.compile(pattern) for pattern in OFFICIAL_NAME_PATTERNS]
+    
+    # Row/text patterns, compiled once
+    AGE_RE = re.compile(r'(\d{2})歳')
+    KANJI_NAME_RE = re.compile(r'[\u4e00-\u9fff]{2,4}\s*[\u4e00-\u9fff]{1,4}')
+    KANJI_RUN_RE = re.compile(r'[\u4e00-\u9fff]{2,6}')
+    
+    # Div class names that suggest official entries, in priority order
+    DIV_CLASS_NAMES = ['member', 'official', 'council', 'giin', 'list-item']
+    DIV_CLASS_RES = {name: re.compile(name, re.I) for name in DIV_CLASS_NAMES}
     
     def __init__(self, *args, **kwargs):
         """Initialize smart municipal scraper."""
         super().__init__(*args, **kwargs)
         self.visited_urls: Set[str] = set()
+        # Parsed list pages found while crawling, reused for extraction
+        self._list_page_roots: Dict[str, etree._Element] = {}
     
     def scrape(self, url: str) -> List[Dict[str, Any]]:
         """
@@ -78,6 +110,7 @@ class SmartMunicipalScraper(BaseScraper):
         """
         self.logger.info(f"Scraping municipality: {municipality_name or base_url}")
         self.visited_urls.clear()
+        self._list_page_roots.clear()
         
         officials = []
         
@@ -118,6 +151,9 @@ class SmartMunicipalScraper(BaseScraper):
         """
         Find pages that likely contain official lists.
         
+        List pages stay parsed for _extract_officials_from_page, so they
+        are not downloaded twice.
+        
         Args:
             base_url: Starting URL
             max_depth: Maximum crawl depth
@@ -126,11 +162,11 @@ class SmartMunicipalScraper(BaseScraper):
             List of potential list page URLs
         """
         list_pages = []
-        to_visit = [(base_url, 0)]
+        to_visit = deque([(base_url, 0)])
         self.visited_urls.add(base_url)
         
         while to_visit:
-            url, depth = to_visit.pop(0)
+            url, depth = to_visit.popleft()
             
             if depth > max_depth:
                 continue
@@ -140,15 +176,16 @@ class SmartMunicipalScraper(BaseScraper):
                 if not response:
                     continue
                 
-                soup = parse_html(response.text)
+                root = parse_html_fast(response.text)
                 
                 # Check if current page is a list page
-                if self._is_list_page(soup):
+                if self._is_list_page(root):
                     list_pages.append(url)
+                    self._list_page_roots[url] = root
                 
                 # Find links to potential list pages (only if not too deep)
                 if depth < max_depth:
-                    links = self._find_relevant_links(soup, url)
+                    links = self._find_relevant_links(root, url)
                     for link in links:
                         if link not in self.visited_urls:
                             self.visited_urls.add(link)
@@ -160,44 +197,49 @@ class SmartMunicipalScraper(BaseScraper):
         
         return list_pages
     
-    def _is_list_page(self, soup: BeautifulSoup) -> bool:
+    def _is_list_page(self, root: etree._Element) -> bool:
         """Check if page contains official list."""
-        page_text = soup.get_text().lower()
-        
-        # Check for list keywords
-        for keyword in self.LIST_PAGE_KEYWORDS:
-            if keyword.lower() in page_text:
+        # Check for list keywords text node by text node, stopping at the
+        # first hit; the previous tail is carried over so a keyword split
+        # across nodes (議員<b>一覧</b>) is still found
+        overlap = self.LIST_PAGE_KEYWORD_MAX_LEN - 1
+        tail = ''
+        for chunk in root.itertext():
+            window = tail + chunk.lower()
+            if self.LIST_PAGE_KEYWORD_RE.search(window):
                 return True
+            tail = window[-overlap:]
         
         # Check for table structures with multiple officials
-        tables = soup.find_all('table')
-        for table in tables:
-            rows = table.find_all('tr')
-            if len(rows) >= 3:  # At least header + 2 officials
+        for table in root.iter('table'):
+            # At least header + 2 officials; stops counting at the third row
+            if next(islice(table.iter('tr'), 2, None), None) is not None:
                 # Check if table contains names
-                table_text = table.get_text()
-                name_matches = sum(1 for pattern in self.OFFICIAL_NAME_PATTERNS 
-                                 if re.search(pattern, table_text))
+                table_text = extract_text(table, strip=False)
+                name_matches = sum(1 for pattern in self.OFFICIAL_NAME_RES
+                                 if pattern.search(table_text))
                 if name_matches >= 2:
                     return True
         
         return False
     
-    def _find_relevant_links(self, soup: BeautifulSoup, base_url: str) -> List[str]:
+    def _find_relevant_links(self, root: etree._Element, base_url: str) -> List[str]:
         """Find links that might lead to official lists."""
         relevant_links = []
+        base_netloc = urlparse(base_url).netloc
         
-        for link in soup.find_all('a', href=True):
-            href = link['href']
-            link_text = link.get_text().strip().lower()
+        for link in root.xpath('.//a[@href]'):
+            href = link.get('href')
+            if self.SKIP_LINK_RE.search(href):
+                continue
             
-            # Check if link text contains keywords
-            is_relevant = any(keyword.lower() in link_text for keyword in self.LIST_PAGE_KEYWORDS)
+            link_text = extract_text(link, strip=False).strip().lower()
             
-            if is_relevant:
+            # Check if link text contains keywords
+            if self.LIST_PAGE_KEYWORD_RE.search(link_text):
                 full_url = urljoin(base_url, href)
                 # Only follow links on same domain
-                if urlparse(full_url).netloc == urlparse(base_url).netloc:
+                if urlparse(full_url).netloc == base_netloc:
                     relevant_links.append(full_url)
         
         return relevant_links
@@ -209,11 +251,13 @@ class SmartMunicipalScraper(BaseScraper):
         prefecture: Optional[str],
     ) -> List[Dict[str, Any]]:
         """Extract official data from a single page."""
-        response = self.http.get(url)
-        if not response:
-            return []
+        root = self._list_page_roots.pop(url, None)
+        if root is None:
+            response = self.http.get(url)
+            if not response:
+                return []
+            root = parse_html_fast(response.text)
         
-        soup = parse_html(response.text)
         officials = []
         
         # Try different extraction strategies
@@ -225,7 +269,7 @@ class SmartMunicipalScraper(BaseScraper):
         
         for strategy in strategies:
             try:
-                results = strategy(soup, url, municipality_name, prefecture)
+                results = strategy(root, url, municipality_name, prefecture)
                 if results:
                     officials.extend(results)
                     self.logger.debug(f"Strategy {strategy.__name__} found {len(results)} officials")
@@ -237,7 +281,7 @@ class SmartMunicipalScraper(BaseScraper):
     
     def _extract_from_table(
         self,
-        soup: BeautifulSoup,
+        root: etree._Element,
         url: str,
         municipality_name: Optional[str],
         prefecture: Optional[str],
@@ -245,9 +289,8 @@ class SmartMunicipalScraper(BaseScraper):
         """Extract officials from HTML tables."""
         officials = []
         
-        tables = soup.find_all('table')
-        for table in tables:
-            rows = table.find_all('tr')
+        for table in root.iter('table'):
+            rows = list(table.iter('tr'))
             
             # Skip tables with too few rows
             if len(rows) < 2:
@@ -255,26 +298,30 @@ class SmartMunicipalScraper(BaseScraper):
             
             # Try to find header row
             header_row = rows[0]
-            headers = [th.get_text().strip() for th in header_row.find_all(['th', 'td'])]
+            headers = [extract_text(th, strip=False).strip()
+                       for th in header_row.iter('th', 'td')]
             
             # Find name column index
             name_col_idx = self._find_name_column(headers)
             
             # Process data rows
-            for row in rows[1:]:
-                cells = row.find_all(['td', 'th'])
+            for row in islice(rows, 1, None):
+                # Each cell's text is extracted once and reused below
+                cell_texts = tuple(
+                    clean_text(extract_text(cell, strip=False))
+                    for cell in row.iter('td', 'th')
+                )
                 
-                if len(cells) == 0:
+                if len(cell_texts) == 0:
                     continue
                 
                 # Extract name
                 name = None
-                if name_col_idx is not None and name_col_idx < len(cells):
-                    name = clean_text(cells[name_col_idx].get_text())
+                if name_col_idx is not None and name_col_idx < len(cell_texts):
+                    name = cell_texts[name_col_idx]
                 else:
                     # Fallback: first cell with Japanese characters
-                    for cell in cells:
-                        text = clean_text(cell.get_text())
+                    for text in cell_texts:
                         if self._looks_like_name(text):
                             name = text
                             break
@@ -291,16 +338,14 @@ class SmartMunicipalScraper(BaseScraper):
                     }
                     
                     # Try to extract additional info from other cells
-                    for idx, cell in enumerate(cells):
-                        cell_text = clean_text(cell.get_text())
-                        
+                    for cell_text in cell_texts:
                         # Age detection
-                        age_match = re.search(r'(\d{2})歳', cell_text)
+                        age_match = self.AGE_RE.search(cell_text)
                         if age_match:
                             official_data['age'] = int(age_match.group(1))
                         
                         # Party/faction detection
-                        if any(party in cell_text for party in ['党', '会派', '無所属']):
+                        if self.PARTY_RE.search(cell_text):
                             official_data['faction'] = cell_text
                     
                     officials.append(official_data)
@@ -309,7 +354,7 @@ class SmartMunicipalScraper(BaseScraper):
     
     def _extract_from_list(
         self,
-        soup: BeautifulSoup,
+        root: etree._Element,
         url: str,
         municipality_name: Optional[str],
         prefecture: Optional[str],
@@ -317,14 +362,14 @@ class SmartMunicipalScraper(BaseScraper):
         """Extract officials from HTML lists (ul, ol)."""
         officials = []
         
-        for list_tag in soup.find_all(['ul', 'ol']):
-            items = list_tag.find_all('li')
+        for list_tag in root.xpath('.//ul | .//ol'):
+            items = list(list_tag.iter('li'))
             
             if len(items) < 2:
                 continue
             
             for item in items:
-                text = clean_text(item.get_text())
+                text = clean_text(extract_text(item, strip=False))
                 
                 if self._looks_like_name(text):
                     # Extract just the name part
@@ -345,7 +390,7 @@ class SmartMunicipalScraper(BaseScraper):
     
     def _extract_from_divs(
         self,
-        soup: BeautifulSoup,
+        root: etree._Element,
         url: str,
         municipality_name: Optional[str],
         prefecture: Optional[str],
@@ -354,13 +399,12 @@ class SmartMunicipalScraper(BaseScraper):
         officials = []
         
         # Look for divs with common class names
-        common_classes = ['member', 'official', 'council', 'giin', 'list-item']
-        
-        for class_name in common_classes:
-            divs = soup.find_all('div', class_=re.compile(class_name, re.I))
+        for class_re in self.DIV_CLASS_RES.values():
+            divs = [div for div in root.iter('div')
+                    if class_re.search(div.get('class', ''))]
             
             for div in divs:
-                text = clean_text(div.get_text())
+                text = clean_text(extract_text(div, strip=False))
                 
                 if self._looks_like_name(text):
                     name = self._extract_name_from_text(text)
@@ -395,8 +439,7 @@ class SmartMunicipalScraper(BaseScraper):
             return False
         
         # Check for kanji patterns
-        kanji_pattern = r'[\u4e00-\u9fff]{2,6}'
-        if re.search(kanji_pattern, text):
+        if self.KANJI_RUN_RE.search(text):
             return True
         
         return False
@@ -404,7 +447,7 @@ class SmartMunicipalScraper(BaseScraper):
     def _extract_name_from_text(self, text: str) -> Optional[str]:
         """Extract name from text that may contain other info."""
         # Try to match kanji name pattern
-        match = re.search(r'[\u4e00-\u9fff]{2,4}\s*[\u4e00-\u9fff]{1,4}', text)
+        match = self.KANJI_NAME_RE.search(text)
         if match:
             return match.group(0).strip()
         
@@ -415,14 +458,15 @@ class SmartMunicipalScraper(BaseScraper):
         return None
     
     def _deduplicate_officials(self, officials: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-        """Remove duplicate officials based on name."""
+        """Remove duplicate officials based on normalized name (first one wins)."""
         seen_names = set()
         unique_officials = []
         
         for official in officials:
-            name = official.get('name')
-            if name and name not in seen_names:
-                seen_names.add(name)
+            # Cached normalization, so width/case/honorific variants collapse
+            key = normalize_name(official.get('name') or '')
+            if key and key not in seen_names:
+                seen_names.add(key)
                 unique_officials.append(official)
         
         return unique_officials
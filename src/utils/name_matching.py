@@ -4,6 +4,7 @@ Uses fuzzy matching, normalization, and optional semantic similarity.
 """
 
 from typing import List, Tuple, Optional, Dict
+from functools import lru_cache
 import re
 import unicodedata
 
@@ -12,11 +13,26 @@ from ..core.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Common suffixes/prefixes dropped from names, removed in one regex pass
+_NAME_SUFFIXES = (
+    'inc.', 'inc', 'ltd.', 'ltd', 'llc', 'corp', 'corporation',
+    '株式会社', '有限会社', '合同会社', '氏', '様', '先生', '議員',
+    'co.', 'company', 'group', 'holdings',
+)
+_SUFFIX_RE = re.compile(
+    r'\b(?:' + '|'.join(map(re.escape, _NAME_SUFFIXES)) + r')\b', re.IGNORECASE
+)
+_SPECIAL_RE = re.compile(r'[^\w\s]')
 
+
+@lru_cache(maxsize=100_000)
 def normalize_name(name: str) -> str:
     """
     Normalize name for matching.
     
+    Memoized: batch matching normalizes the same candidate list once per
+    query, so each distinct name is only normalized once.
+    
     Args:
         name: Name to normalize
         
@@ -29,21 +45,15 @@ def normalize_name(name: str) -> str:
     # Convert to lowercase
     name = name.lower()
     
-    # Remove common suffixes/prefixes
-    suffixes_to_remove = [
-        'inc.', 'inc', 'ltd.', 'ltd', 'llc', 'corp', 'corporation',
-        '株式会社', '有限会社', '合同会社', '氏', '様', '先生', '議員',
-        'co.', 'company', 'group', 'holdings',
-    ]
+    # Normalize unicode (convert fullwidth to halfwidth, etc.) first, so
+    # fullwidth suffixes and punctuation are caught below
+    name = unicodedata.normalize('NFKC', name)
     
-    for suffix in suffixes_to_remove:
-        name = re.sub(rf'\b{re.escape(suffix)}\b', '', name, flags=re.IGNORECASE)
+    # Remove common suffixes/prefixes
+    name = _SUFFIX_RE.sub('', name)
     
     # Remove special characters
-    name = re.sub(r'[^\w\s]', '', name)
-    
-    # Normalize unicode (convert fullwidth to halfwidth, etc.)
-    name = unicodedata.normalize('NFKC', name)
+    name = _SPECIAL_RE.sub('', name)
     
     # Remove extra whitespace
     name = ' '.join(name.split())
@@ -51,6 +61,37 @@ def normalize_name(name: str) -> str:
     return name.strip()
 
 
+def _token_sorted(name: str) -> str:
+    """
+    Name as token_sort_ratio compares it: processed, tokens sorted and re-joined.
+    
+    fuzz.ratio on two such strings equals token_sort_ratio with
+    default_process on the originals.
+    """
+    from rapidfuzz import utils
+    
+    return ' '.join(sorted(utils.default_process(name).split()))
+
+
+@lru_cache(maxsize=8)
+def _token_sorted_candidates(candidates: Tuple[str, ...]):
+    """
+    Pre-tokenize a candidate list once for repeated queries.
+    
+    Args:
+        candidates: Candidate names
+        
+    Returns:
+        Tuple of (token-sorted strings, their lengths as a NumPy array),
+        parallel to candidates
+    """
+    import numpy as np
+    
+    sorted_names = [_token_sorted(candidate) for candidate in candidates]
+    lengths = np.fromiter(map(len, sorted_names), dtype=np.int64, count=len(sorted_names))
+    return sorted_names, lengths
+
+
 def fuzzy_match(
     query: str,
     candidates: List[str],
@@ -70,22 +111,35 @@ def fuzzy_match(
         List of (match, score) tuples
     """
     try:
+        import numpy as np
         from rapidfuzz import process, fuzz
         
-        # Use token_sort_ratio for better handling of word order
+        # Use token_sort_ratio for better handling of word order. Candidates
+        # are processed (case/punctuation folded) and token-sorted once per
+        # list, so each query only runs a plain ratio against them
+        sorted_names, lengths = _token_sorted_candidates(tuple(candidates))
+        query_sorted = _token_sorted(query)
+        
+        # The ratio can't exceed 200 * min(len) / (sum of lens), so skip
+        # candidates whose length alone rules out the threshold
+        indices = np.arange(len(candidates))
+        if threshold > 0:
+            query_len = len(query_sorted)
+            reachable = 200 * np.minimum(lengths, query_len) >= (threshold - 1e-6) * (lengths + query_len)
+            indices = np.flatnonzero(reachable)
+        
+        # Candidates under the threshold are pruned during scoring
         results = process.extract(
-            query,
-            candidates,
-            scorer=fuzz.token_sort_ratio,
+            query_sorted,
+            [sorted_names[i] for i in indices],
+            scorer=fuzz.ratio,
+            score_cutoff=threshold,
             limit=limit,
         )
         
-        # Filter by threshold
-        filtered = [(match, score, idx) for match, score, idx in results if score >= threshold]
+        logger.debug(f"Fuzzy match for '{query}': found {len(results)} matches above {threshold}")
         
-        logger.debug(f"Fuzzy match for '{query}': found {len(filtered)} matches above {threshold}")
-        
-        return [(match, score) for match, score, idx in filtered]
+        return [(candidates[indices[idx]], score) for _, score, idx in results]
         
     except ImportError:
         logger.warning("rapidfuzz not installed. Install with: pip install rapidfuzz")
@@ -117,19 +171,58 @@ def match_names_batch(
     Returns:
         Dict mapping query to best match (or None)
     """
-    results = {}
+    if not candidates:
+        return {query: None for query in queries}
     
-    for query in queries:
-        matches = fuzzy_match(query, candidates, threshold=threshold, limit=1)
+    try:
+        import numpy as np
+        from rapidfuzz import process, fuzz
+    except ImportError:
+        logger.warning("rapidfuzz not installed. Install with: pip install rapidfuzz")
         
-        if matches:
-            results[query] = matches[0][0]  # Best match
-        else:
-            results[query] = None
+        # Same exact-match fallback as fuzzy_match, but the normalized
+        # candidate index is built once instead of rescanned per query
+        name_index = create_name_index(candidates)
+        return {query: find_exact_match(query, name_index) for query in queries}
+    
+    if not queries:
+        return {}
+    
+    # Score the full query x candidate matrix in one native call;
+    # scores under the threshold come back as 0
+    sorted_names, _ = _token_sorted_candidates(tuple(candidates))
+    scores = process.cdist(
+        [_token_sorted(query) for query in queries],
+        sorted_names,
+        scorer=fuzz.ratio,
+        score_cutoff=threshold,
+        dtype=np.float64,
+        workers=-1,
+    )
+    best = scores.argmax(axis=1)  # First best on ties, like extract()
+    
+    results = {}
+    for i, query in enumerate(queries):
+        idx = best[i]
+        results[query] = candidates[idx] if scores[i, idx] >= threshold else None
     
     return results
 
 
+@lru_cache(maxsize=1)
+def _get_sentence_model():
+    """Load the sentence-transformers model once per process."""
+    from sentence_transformers import SentenceTransformer
+    
+    return SentenceTransformer('sentence-transformers/all-MiniLM-L6-v2')
+
+
+@lru_cache(maxsize=10)
+def _encode_candidates(candidates: Tuple[str, ...]):
+    """Embed a candidate list, cached so repeated queries reuse the embeddings."""
+    return _get_sentence_model().encode(list(candidates), convert_to_tensor=True)
+
+
 def semantic_match(
     query: str,
     candidates: List[str],
@@ -149,22 +242,23 @@ def semantic_match(
         List of (match, similarity) tuples
     """
     try:
-        from sentence_transformers import SentenceTransformer, util
-        import torch
+        import numpy as np
+        from sentence_transformers import util
         
-        # Load model (cached after first load)
-        model = SentenceTransformer('sentence-transformers/all-MiniLM-L6-v2')
+        if not candidates or limit <= 0:
+            return []
         
-        # Encode
-        query_emb = model.encode(query, convert_to_tensor=True)
-        candidate_embs = model.encode(candidates, convert_to_tensor=True)
+        # Model and candidate embeddings are cached across calls
+        query_emb = _get_sentence_model().encode(query, convert_to_tensor=True)
+        candidate_embs = _encode_candidates(tuple(candidates))
         
         # Compute similarities
-        similarities = util.pytorch_cos_sim(query_emb, candidate_embs)[0]
+        scores = util.cos_sim(query_emb, candidate_embs)[0].cpu().numpy()
         
-        # Get top matches
-        scores = similarities.cpu().numpy()
-        top_indices = scores.argsort()[-limit:][::-1]
+        # Get top matches: partial selection, then sort just those
+        k = min(limit, len(scores))
+        top_indices = np.argpartition(-scores, k - 1)[:k]
+        top_indices = top_indices[np.argsort(-scores[top_indices])]
         
         results = []
         for idx in top_indices:
@@ -231,6 +325,7 @@ def match_with_fallback(
     fuzzy_threshold: float = 85.0,
     semantic_threshold: float = 0.7,
     use_semantic: bool = False,
+    name_index: Optional[Dict[str, List[str]]] = None,
 ) -> Optional[Tuple[str, float, str]]:
     """
     Match with multiple fallback strategies.
@@ -241,12 +336,15 @@ def match_with_fallback(
         fuzzy_threshold: Threshold for fuzzy matching
         semantic_threshold: Threshold for semantic matching
         use_semantic: Whether to use semantic matching
+        name_index: Pre-built index of candidates (see create_name_index),
+            to avoid rebuilding it when matching many queries
         
     Returns:
         Tuple of (match, score, method) or None
     """
     # 1. Try exact match (normalized)
-    name_index = create_name_index(candidates)
+    if name_index is None:
+        name_index = create_name_index(candidates)
     exact_match = find_exact_match(query, name_index)
     
     if exact_match:
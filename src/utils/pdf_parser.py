@@ -3,20 +3,121 @@ PDF parsing utilities for extracting funding data from PDF reports.
 Supports both tabular extraction and OCR fallback.
 """
 
-from typing import Dict, Optional, List, Any
+from typing import Dict, Optional, List, Any, Set
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 from pathlib import Path
+import hashlib
+import importlib.util
+import json
+import multiprocessing
+import os
 import re
 import tempfile
+import time
 
 from ..core.logger import get_logger
 
 
 logger = get_logger(__name__)
 
+# Funding total patterns, compiled once at import, in priority order.
+# Narrower patterns (flagged True) only match where the broader pattern
+# before them for the same total also matches, so they are skipped once
+# that pattern has found nothing.
+_FUNDING_TOTAL_RES = [
+    # Income patterns
+    (re.compile(r'収入[合計総額\s]*[:：]\s*([0-9,]+)\s*円?'), 'income_total', False),
+    (re.compile(r'収入総額[：:]\s*([0-9,]+)'), 'income_total', True),
+    (re.compile(r'総収入[：:]\s*([0-9,]+)'), 'income_total', True),
+    
+    # Expense patterns
+    (re.compile(r'支出[合計総額\s]*[:：]\s*([0-9,]+)\s*円?'), 'expense_total', False),
+    (re.compile(r'支出総額[：:]\s*([0-9,]+)'), 'expense_total', True),
+    (re.compile(r'総支出[：:]\s*([0-9,]+)'), 'expense_total', True),
+    
+    # Balance patterns
+    (re.compile(r'残高[：:]\s*([0-9,]+)'), 'balance', False),
+    (re.compile(r'差引[残高]*[：:]\s*([0-9,]+)'), 'balance', False),
+]
+
+# Funding table row keywords (lowercase) -> total they label, matched in one pass
+_FUNDING_ROW_KEYWORDS = {
+    '収入': 'income_total',
+    'income': 'income_total',
+    '支出': 'expense_total',
+    'expense': 'expense_total',
+    '残高': 'balance',
+    '差引': 'balance',
+    'balance': 'balance',
+}
+_FUNDING_ROW_KEYWORD_RE = re.compile('|'.join(map(re.escape, _FUNDING_ROW_KEYWORDS)))
+
+# Cached parse results: bump the version when parsing changes so older
+# results are not reused; entries older than the max age are ignored and pruned
+_PDF_CACHE_VERSION = 1
+_PDF_CACHE_MAX_AGE = 30 * 86400
+
+# Cache directories already pruned by this process
+_pruned_pdf_cache_dirs: Set[str] = set()
+
+# pdfplumber worker processes only pay off with several pages each
+_MIN_PAGES_PER_WORKER = 4
+
+# A PDF whose first pages carry this much embedded text is not a scan
+_TEXT_LAYER_SAMPLE_PAGES = 3
+_TEXT_LAYER_MIN_CHARS = 500
+
+
+def _worker_context():
+    """
+    Start method for worker pools.
+    
+    Workers are not forked, since the caller may have other threads (e.g. a
+    download) holding locks that a forked child would inherit locked.
+    """
+    if 'forkserver' in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context('forkserver')
+    return multiprocessing.get_context('spawn')
+
+
+def _extract_pdfplumber_tables(
+    pdf_path: str,
+    page_numbers: Optional[List[int]] = None,
+) -> List[List[List[str]]]:
+    """
+    Extract tables from (some pages of) a PDF with pdfplumber.
+    
+    Kept at module level so it can run in a worker process.
+    
+    Args:
+        pdf_path: Path to PDF file
+        page_numbers: 1-based pages to parse (all pages if None)
+        
+    Returns:
+        List of tables (each table is list of rows)
+    """
+    import pdfplumber
+    
+    tables = []
+    with pdfplumber.open(pdf_path, pages=page_numbers) as pdf:
+        for page in pdf.pages:
+            page_tables = page.extract_tables()
+            if page_tables:
+                tables.extend(page_tables)
+    return tables
+
 
 def extract_tables_from_pdf(pdf_path: str) -> List[List[List[str]]]:
     """
-    Extract tables from PDF using pdfplumber.
+    Extract tables from PDF.
+    
+    Uses PyMuPDF (native MuPDF core) when installed, which is much faster
+    than pdfplumber's pure-Python layout analysis; pdfplumber is used when
+    PyMuPDF is missing, fails, or finds no tables. pdfplumber is CPU-bound
+    Python, so long PDFs are split into contiguous page batches of at
+    least _MIN_PAGES_PER_WORKER pages, one per core, and parsed in worker
+    processes.
     
     Args:
         pdf_path: Path to PDF file
@@ -24,15 +125,55 @@ def extract_tables_from_pdf(pdf_path: str) -> List[List[List[str]]]:
     Returns:
         List of tables (each table is list of rows)
     """
+    try:
+        import fitz
+    except ImportError:  # optional fast backend, falls back to pdfplumber
+        fitz = None
+    
+    if fitz is not None:
+        try:
+            tables = []
+            with fitz.open(pdf_path) as doc:
+                for page in doc:
+                    for table in page.find_tables().tables:
+                        tables.append(table.extract())
+            
+            if tables:
+                logger.info(f"Extracted {len(tables)} tables from {pdf_path} (PyMuPDF)")
+                return tables
+        except Exception as e:
+            logger.debug(f"PyMuPDF table extraction failed for {pdf_path}: {e}")
+    
     try:
         import pdfplumber
         
-        tables = []
         with pdfplumber.open(pdf_path) as pdf:
-            for page in pdf.pages:
-                page_tables = page.extract_tables()
-                if page_tables:
-                    tables.extend(page_tables)
+            page_count = len(pdf.pages)
+        
+        workers = min(os.cpu_count() or 1, page_count // _MIN_PAGES_PER_WORKER)
+        if workers <= 1:
+            tables = _extract_pdfplumber_tables(pdf_path)
+        else:
+            batch_size = -(-page_count // workers)
+            batches = [
+                list(range(start + 1, min(start + batch_size, page_count) + 1))
+                for start in range(0, page_count, batch_size)
+            ]
+            try:
+                with ProcessPoolExecutor(
+                    max_workers=workers,
+                    mp_context=_worker_context(),
+                ) as executor:
+                    tables = [
+                        table
+                        for batch_tables in executor.map(
+                            _extract_pdfplumber_tables, [pdf_path] * len(batches), batches
+                        )
+                        for table in batch_tables
+                    ]
+            except Exception as e:
+                logger.debug(f"pdfplumber worker pool failed for {pdf_path}, parsing in-process: {e}")
+                tables = _extract_pdfplumber_tables(pdf_path)
         
         logger.info(f"Extracted {len(tables)} tables from {pdf_path}")
         return tables
@@ -45,28 +186,146 @@ def extract_tables_from_pdf(pdf_path: str) -> List[List[List[str]]]:
         return []
 
 
-def extract_text_from_pdf_ocr(pdf_path: str) -> str:
+def extract_page_texts_from_pdf(pdf_path: str) -> List[str]:
+    """
+    Extract the embedded text layer of each page (no OCR).
+    
+    Uses PyMuPDF when installed, otherwise pdfplumber. Scanned pages come
+    back empty.
+    
+    Args:
+        pdf_path: Path to PDF file
+        
+    Returns:
+        Text per page ([] if no backend is installed or extraction fails)
+    """
+    try:
+        import fitz
+    except ImportError:  # optional fast backend, falls back to pdfplumber
+        fitz = None
+    
+    try:
+        if fitz is not None:
+            with fitz.open(pdf_path) as doc:
+                return [page.get_text() for page in doc]
+        
+        import pdfplumber
+        
+        with pdfplumber.open(pdf_path) as pdf:
+            return [page.extract_text() or '' for page in pdf.pages]
+        
+    except ImportError:
+        logger.warning("pdfplumber not installed. Install with: pip install pdfplumber")
+        return []
+    except Exception as e:
+        logger.error(f"Failed to extract text from {pdf_path}: {e}")
+        return []
+
+
+def _limit_ocr_threads():
+    """Pool initializer: cap tesseract to one OpenMP thread in the worker."""
+    os.environ['OMP_THREAD_LIMIT'] = '1'
+
+
+def _ocr_pdf_pages(pdf_path: str, dpi: int, first_page: int, last_page: int) -> List[str]:
+    """
+    OCR a range of PDF pages.
+    
+    Args:
+        pdf_path: Path to PDF file
+        dpi: Rasterization resolution
+        first_page: First page to OCR (1-based)
+        last_page: Last page to OCR (inclusive)
+        
+    Returns:
+        Text per page
+    """
+    from pdf2image import convert_from_path
+    
+    try:
+        import tesserocr
+    except ImportError:  # optional in-process engine, falls back to pytesseract
+        tesserocr = None
+    
+    images = convert_from_path(pdf_path, dpi=dpi, first_page=first_page, last_page=last_page)
+    
+    if tesserocr is None:
+        import pytesseract
+        
+        texts = []
+        for page, image in enumerate(images, first_page):
+            logger.debug(f"OCR processing page {page}")
+            texts.append(pytesseract.image_to_string(image, lang='jpn+eng', config='--psm 6'))
+        return texts
+    
+    with tesserocr.PyTessBaseAPI(lang='jpn+eng', psm=tesserocr.PSM.SINGLE_BLOCK) as api:
+        texts = []
+        for page, image in enumerate(images, first_page):
+            logger.debug(f"OCR processing page {page}")
+            api.SetImage(image)
+            texts.append(api.GetUTF8Text())
+        return texts
+
+
+def extract_text_from_pdf_ocr(pdf_path: str, dpi: int = 200) -> str:
     """
     Extract text from PDF using OCR (for scanned PDFs).
     
+    Multi-page PDFs are split into one contiguous page batch per core and
+    OCR'd in worker processes, each limited to one tesseract thread
+    (OMP_THREAD_LIMIT=1 is set in the workers only): tesseract's own
+    OpenMP threading scales poorly, so page-level parallelism wins. With
+    tesserocr installed each batch runs on one in-process engine, so the
+    language model is loaded once per worker instead of once per page;
+    otherwise pytesseract runs a tesseract process per page. Pages are read
+    as a single uniform block of text (page segmentation mode 6), which
+    suits sparse funding reports and skips layout analysis.
+    
     Args:
         pdf_path: Path to PDF file
+        dpi: Rasterization resolution; 200 is enough for typical reports,
+            raise to 300 for poor-quality scans
         
     Returns:
         Extracted text
     """
     try:
-        from pdf2image import convert_from_path
-        import pytesseract
+        from pdf2image import pdfinfo_from_path
         
-        # Convert PDF to images
-        images = convert_from_path(pdf_path, dpi=300)
+        if importlib.util.find_spec('tesserocr') is None:
+            import pytesseract  # noqa: F401
         
-        text = ""
-        for i, image in enumerate(images):
-            logger.debug(f"OCR processing page {i+1}/{len(images)}")
-            page_text = pytesseract.image_to_string(image, lang='jpn+eng')
-            text += page_text + "\n"
+        page_count = pdfinfo_from_path(pdf_path)['Pages']
+        
+        workers = min(page_count, os.cpu_count() or 1)
+        if workers <= 1:
+            page_texts = _ocr_pdf_pages(pdf_path, dpi, 1, page_count)
+        else:
+            batch_size = -(-page_count // workers)
+            starts = list(range(1, page_count + 1, batch_size))
+            ends = [min(start + batch_size - 1, page_count) for start in starts]
+            try:
+                with ProcessPoolExecutor(
+                    max_workers=len(starts),
+                    mp_context=_worker_context(),
+                    initializer=_limit_ocr_threads,
+                ) as executor:
+                    page_texts = [
+                        page_text
+                        for batch_texts in executor.map(
+                            _ocr_pdf_pages,
+                            [pdf_path] * len(starts),
+                            [dpi] * len(starts),
+                            starts,
+                            ends,
+                        )
+                        for page_text in batch_texts
+                    ]
+            except Exception as e:
+                logger.debug(f"OCR worker pool failed for {pdf_path}, running in-process: {e}")
+                page_texts = _ocr_pdf_pages(pdf_path, dpi, 1, page_count)
+        
+        text = "".join(page_text + "\n" for page_text in page_texts)
         
         logger.info(f"Extracted {len(text)} characters via OCR from {pdf_path}")
         return text
@@ -98,25 +357,10 @@ def parse_funding_totals_from_text(text: str) -> Dict[str, Optional[float]]:
     }
     
     # Japanese patterns
-    patterns = [
-        # Income patterns
-        (r'収入[合計総額\s]*[:：]\s*([0-9,]+)\s*円?', 'income_total'),
-        (r'収入総額[：:]\s*([0-9,]+)', 'income_total'),
-        (r'総収入[：:]\s*([0-9,]+)', 'income_total'),
-        
-        # Expense patterns
-        (r'支出[合計総額\s]*[:：]\s*([0-9,]+)\s*円?', 'expense_total'),
-        (r'支出総額[：:]\s*([0-9,]+)', 'expense_total'),
-        (r'総支出[：:]\s*([0-9,]+)', 'expense_total'),
-        
-        # Balance patterns
-        (r'残高[：:]\s*([0-9,]+)', 'balance'),
-        (r'差引[残高]*[：:]\s*([0-9,]+)', 'balance'),
-    ]
-    
-    for pattern, key in patterns:
-        if totals[key] is None:  # Only set if not already found
-            match = re.search(pattern, text)
+    unmatched = set()  # Totals whose broader pattern found nothing
+    for pattern, key, narrower in _FUNDING_TOTAL_RES:
+        if totals[key] is None and not (narrower and key in unmatched):
+            match = pattern.search(text)
             if match:
                 amount_str = match.group(1).replace(',', '')
                 try:
@@ -124,6 +368,8 @@ def parse_funding_totals_from_text(text: str) -> Dict[str, Optional[float]]:
                     logger.debug(f"Found {key}: {totals[key]}")
                 except ValueError:
                     pass
+            elif not narrower:
+                unmatched.add(key)
     
     # Calculate balance if not found
     if totals['balance'] is None and totals['income_total'] and totals['expense_total']:
@@ -148,25 +394,18 @@ def parse_funding_from_tables(tables: List[List[List[str]]]) -> Dict[str, Option
         'balance': None,
     }
     
-    # Keywords to identify rows
-    income_keywords = ['収入', '総収入', 'income']
-    expense_keywords = ['支出', '総支出', 'expense']
-    balance_keywords = ['残高', '差引', 'balance']
-    
     for table in tables:
         for row in table:
             if not row or len(row) < 2:
                 continue
             
-            # Convert row to strings
-            row_strs = [str(cell).lower() if cell else '' for cell in row]
-            row_text = ' '.join(row_strs)
-            
             # Look for amounts (numbers with commas)
             amounts = []
             for cell in row:
                 if cell:
                     cleaned = str(cell).replace(',', '').replace('円', '').strip()
+                    # replace() hands back the same string when there is no
+                    # '.', so integer cells are tested without a copy
                     if cleaned.replace('.', '').isdigit():
                         try:
                             amounts.append(float(cleaned))
@@ -176,31 +415,83 @@ def parse_funding_from_tables(tables: List[List[List[str]]]) -> Dict[str, Option
             if not amounts:
                 continue
             
+            row_text = ' '.join([str(cell) if cell else '' for cell in row]).lower()
+            labels = {
+                _FUNDING_ROW_KEYWORDS[kw]
+                for kw in _FUNDING_ROW_KEYWORD_RE.findall(row_text)
+            }
+            
             # Match keywords to amounts
-            if any(kw in row_text for kw in income_keywords) and not totals['income_total']:
+            if 'income_total' in labels and not totals['income_total']:
                 totals['income_total'] = max(amounts)  # Usually the largest number
                 
-            elif any(kw in row_text for kw in expense_keywords) and not totals['expense_total']:
+            elif 'expense_total' in labels and not totals['expense_total']:
                 totals['expense_total'] = max(amounts)
                 
-            elif any(kw in row_text for kw in balance_keywords) and not totals['balance']:
+            elif 'balance' in labels and not totals['balance']:
                 totals['balance'] = amounts[0]
+            
+            # Later rows can no longer change anything
+            if all(totals.values()):
+                return totals
     
     return totals
 
 
+@lru_cache(maxsize=1)
+def _pdf_backends() -> str:
+    """Name the installed PDF/OCR backends, which decide what a parse returns."""
+    names = [
+        name for name in ('fitz', 'pdfplumber', 'tesserocr', 'pytesseract')
+        if importlib.util.find_spec(name) is not None
+    ]
+    return '+'.join(names) or 'none'
+
+
+def _prune_pdf_cache(cache_dir: Path):
+    """
+    Delete cached parse results older than _PDF_CACHE_MAX_AGE.
+    
+    Scanning the directory costs a stat per entry, so each directory is
+    pruned once per process rather than on every write.
+    """
+    key = str(cache_dir.resolve())
+    if key in _pruned_pdf_cache_dirs:
+        return
+    _pruned_pdf_cache_dirs.add(key)
+    
+    cutoff = time.time() - _PDF_CACHE_MAX_AGE
+    for path in cache_dir.glob('*.json'):
+        try:
+            if path.stat().st_mtime < cutoff:
+                path.unlink()
+        except OSError:
+            continue
+
+
 def download_and_parse_pdf(
     pdf_url: str,
     http_client,
     use_ocr: bool = False,
+    ocr_dpi: int = 200,
+    cache_dir: Optional[str] = None,
 ) -> Dict[str, Any]:
     """
     Download PDF and extract funding data.
     
+    The PDF is streamed to a temp file, so the whole PDF is never held in
+    memory. With cache_dir set, parse results are cached on disk by the
+    SHA-256 of the PDF bytes, the OCR settings and the installed backends,
+    so an unchanged report is not parsed again for _PDF_CACHE_MAX_AGE.
+    The key needs the PDF bytes, so a cache hit still downloads the PDF;
+    only the parsing (tables, OCR) is saved.
+    
     Args:
         pdf_url: URL to PDF
         http_client: HTTP client for downloading
         use_ocr: Whether to use OCR if table extraction fails
+        ocr_dpi: Rasterization resolution for OCR
+        cache_dir: Directory for cached parse results (None disables)
         
     Returns:
         Dict with totals and extracted text
@@ -212,41 +503,85 @@ def download_and_parse_pdf(
         'text_preview': None,
     }
     
+    tmp_path = None
     try:
-        # Download PDF
         logger.info(f"Downloading PDF: {pdf_url}")
-        response = http_client.get_safe(pdf_url)
+        # Streamed requests bypass the HTTP cache, so chunks go straight
+        # from the socket to the temp file
+        response = http_client.get_safe(pdf_url, stream=True)
         
         if not response:
             logger.warning(f"Failed to download PDF: {pdf_url}")
             return result
         
-        # Save to temp file
-        with tempfile.NamedTemporaryFile(delete=False, suffix='.pdf') as tmp_file:
-            tmp_file.write(response.content)
+        digest = hashlib.sha256()
+        with response, tempfile.NamedTemporaryFile(delete=False, suffix='.pdf') as tmp_file:
             tmp_path = tmp_file.name
+            for chunk in response.iter_content(chunk_size=64 * 1024):
+                tmp_file.write(chunk)
+                digest.update(chunk)
+    
+    except Exception as e:
+        logger.error(f"Failed to download PDF {pdf_url}: {e}")
+        if tmp_path:
+            Path(tmp_path).unlink(missing_ok=True)
+        return result
+    
+    try:
+        cache_file = None
+        if cache_dir:
+            ocr_key = f"ocr{ocr_dpi}" if use_ocr else "noocr"
+            cache_file = Path(cache_dir) / (
+                f"{digest.hexdigest()}_{ocr_key}_{_pdf_backends()}_v{_PDF_CACHE_VERSION}.json"
+            )
+            if (
+                cache_file.exists()
+                and time.time() - cache_file.stat().st_mtime < _PDF_CACHE_MAX_AGE
+            ):
+                try:
+                    with open(cache_file, 'r', encoding='utf-8') as f:
+                        result.update(json.load(f))
+                    logger.debug(f"Cache HIT: {pdf_url}")
+                    return result
+                except Exception as e:
+                    logger.warning(f"Could not load cached PDF result: {e}")
         
-        try:
-            # Try table extraction first
-            tables = extract_tables_from_pdf(tmp_path)
-            if tables:
-                totals = parse_funding_from_tables(tables)
-                result.update(totals)
-            
-            # If no totals found and OCR enabled, try OCR
-            if use_ocr and not any([result['income_total'], result['expense_total']]):
+        # Try table extraction first
+        tables = extract_tables_from_pdf(tmp_path)
+        if tables:
+            totals = parse_funding_from_tables(tables)
+            result.update(totals)
+        
+        # If no totals found and OCR enabled, try the text layer, then OCR.
+        # A text-based PDF gains nothing from OCR, which is far slower.
+        if use_ocr and not any([result['income_total'], result['expense_total']]):
+            page_texts = extract_page_texts_from_pdf(tmp_path)
+            sample = page_texts[:_TEXT_LAYER_SAMPLE_PAGES]
+            if sum(len(page_text) for page_text in sample) > _TEXT_LAYER_MIN_CHARS:
+                logger.info("Table extraction incomplete, parsing embedded text...")
+                text = "\n".join(page_texts)
+            else:
                 logger.info("Table extraction incomplete, trying OCR...")
-                text = extract_text_from_pdf_ocr(tmp_path)
-                if text:
-                    totals = parse_funding_totals_from_text(text)
-                    result.update(totals)
-                    result['text_preview'] = text[:500]  # First 500 chars
-        
-        finally:
-            # Clean up temp file
-            Path(tmp_path).unlink(missing_ok=True)
+                text = extract_text_from_pdf_ocr(tmp_path, dpi=ocr_dpi)
+            if text:
+                totals = parse_funding_totals_from_text(text)
+                result.update(totals)
+                result['text_preview'] = text[:500]  # First 500 chars
+        
+        if cache_file is not None:
+            try:
+                cache_file.parent.mkdir(parents=True, exist_ok=True)
+                _prune_pdf_cache(cache_file.parent)
+                with open(cache_file, 'w', encoding='utf-8') as f:
+                    json.dump(result, f, ensure_ascii=False)
+            except Exception as e:
+                logger.warning(f"Could not save cached PDF result: {e}")
     
     except Exception as e:
         logger.error(f"Failed to parse PDF {pdf_url}: {e}")
     
+    finally:
+        # Clean up temp file
+        Path(tmp_path).unlink(missing_ok=True)
+    
     return result
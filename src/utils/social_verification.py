@@ -3,16 +3,34 @@ Social media verification detection utilities.
 Detects verification badges from HTML without API access.
 """
 
-from typing import Optional, Dict
+from functools import lru_cache
+from typing import Optional, Dict, List
 import re
 
 from ..utils.parsers import parse_html
 from ..core.logger import get_logger
 
+try:
+    import re2
+except ImportError:  # optional linear-time engine, falls back to re
+    re2 = None
+
 
 logger = get_logger(__name__)
 
 
+def _compile(pattern: str):
+    """
+    Compile a case-insensitive pattern for scanning untrusted profile HTML.
+    
+    Uses RE2 (google-re2) when installed: it matches in linear time, so a
+    hostile page can't trigger catastrophic backtracking.
+    """
+    if re2 is not None:
+        return re2.compile('(?i)' + pattern)
+    return re.compile(pattern, re.IGNORECASE)
+
+
 # Platform-specific verification patterns
 VERIFICATION_PATTERNS = {
     'x': [
@@ -50,6 +68,62 @@ VERIFICATION_PATTERNS = {
     ],
 }
 
+# Explicit "not verified" indicators
+_NOT_VERIFIED_RES = [
+    _compile(r'Not verified'),
+    _compile(r'Unverified account'),
+]
+
+# Platform-specific follower count patterns (group 1 is the count)
+FOLLOWER_PATTERNS = {
+    'x': [
+        r'(\d+(?:,\d+)*(?:\.\d+)?[KMB]?)\s*(?:Followers|followers)',
+        r'data-count="(\d+)".*followers',
+    ],
+    'instagram': [
+        r'(\d+(?:,\d+)*(?:\.\d+)?[KMB]?)\s*(?:followers|フォロワー)',
+        r'"edge_followed_by":\s*{\s*"count":\s*(\d+)',
+    ],
+    'facebook': [
+        r'(\d+(?:,\d+)*(?:\.\d+)?[KMB]?)\s*(?:followers|likes)',
+    ],
+    'youtube': [
+        r'(\d+(?:,\d+)*(?:\.\d+)?[KMB]?)\s*(?:subscribers|登録者)',
+        r'"subscriberCountText".*?"simpleText":\s*"([^"]+)"',
+    ],
+}
+
+# Follower count suffixes
+_COUNT_MULTIPLIERS = {
+    'K': 1_000,
+    'M': 1_000_000,
+    'B': 1_000_000_000,
+}
+
+
+@lru_cache(maxsize=None)
+def _verification_res(platform: str) -> List:
+    """Compile a platform's verification patterns on first use."""
+    return [_compile(pattern) for pattern in VERIFICATION_PATTERNS[platform]]
+
+
+@lru_cache(maxsize=None)
+def _follower_res(platform: str) -> List:
+    """Compile a platform's follower count patterns on first use."""
+    return [_compile(pattern) for pattern in FOLLOWER_PATTERNS[platform]]
+
+
+def _may_mention_verified(html: str) -> bool:
+    """
+    Cheap pre-check for the verification and not-verified patterns.
+    
+    Each pattern contains "verified", so pages without it can skip the
+    regex scans. str.lower() doesn't fold the dotted/dotless I (U+0130,
+    U+0131) the way re.IGNORECASE does, so pages containing those still
+    get the full scan.
+    """
+    return 'verified' in html.lower() or '\u0130' in html or '\u0131' in html
+
 
 def detect_verification(html: str, platform: str) -> Optional[bool]:
     """
@@ -65,21 +139,17 @@ def detect_verification(html: str, platform: str) -> Optional[bool]:
     if not html or platform not in VERIFICATION_PATTERNS:
         return None
     
-    patterns = VERIFICATION_PATTERNS[platform]
+    if not _may_mention_verified(html):
+        return None
     
-    for pattern in patterns:
-        if re.search(pattern, html, re.IGNORECASE):
+    for pattern in _verification_res(platform):
+        if pattern.search(html):
             logger.debug(f"Verification badge detected for {platform}")
             return True
     
     # Check for explicit "not verified" indicators
-    not_verified_patterns = [
-        r'Not verified',
-        r'Unverified account',
-    ]
-    
-    for pattern in not_verified_patterns:
-        if re.search(pattern, html, re.IGNORECASE):
+    for pattern in _NOT_VERIFIED_RES:
+        if pattern.search(html):
             logger.debug(f"Account explicitly not verified for {platform}")
             return False
     
@@ -98,32 +168,11 @@ def detect_follower_count(html: str, platform: str) -> Optional[int]:
     Returns:
         Follower count or None
     """
-    if not html:
+    if not html or platform not in FOLLOWER_PATTERNS:
         return None
     
-    # Platform-specific patterns
-    follower_patterns = {
-        'x': [
-            r'(\d+(?:,\d+)*(?:\.\d+)?[KMB]?)\s*(?:Followers|followers)',
-            r'data-count="(\d+)".*followers',
-        ],
-        'instagram': [
-            r'(\d+(?:,\d+)*(?:\.\d+)?[KMB]?)\s*(?:followers|フォロワー)',
-            r'"edge_followed_by":\s*{\s*"count":\s*(\d+)',
-        ],
-        'facebook': [
-            r'(\d+(?:,\d+)*(?:\.\d+)?[KMB]?)\s*(?:followers|likes)',
-        ],
-        'youtube': [
-            r'(\d+(?:,\d+)*(?:\.\d+)?[KMB]?)\s*(?:subscribers|登録者)',
-            r'"subscriberCountText".*?"simpleText":\s*"([^"]+)"',
-        ],
-    }
-    
-    patterns = follower_patterns.get(platform, [])
-    
-    for pattern in patterns:
-        match = re.search(pattern, html, re.IGNORECASE)
+    for pattern in _follower_res(platform):
+        match = pattern.search(html)
         if match:
             count_str = match.group(1)
             return _parse_count(count_str)
@@ -147,23 +196,14 @@ def _parse_count(count_str: str) -> Optional[int]:
     # Remove commas
     count_str = count_str.replace(',', '')
     
-    # Handle K, M, B suffixes
-    multipliers = {
-        'K': 1_000,
-        'M': 1_000_000,
-        'B': 1_000_000_000,
-    }
-    
-    for suffix, multiplier in multipliers.items():
-        if count_str.upper().endswith(suffix):
-            try:
-                number = float(count_str[:-1])
-                return int(number * multiplier)
-            except ValueError:
-                return None
+    # Handle K, M, B suffixes: only the last character can be one
+    multiplier = _COUNT_MULTIPLIERS.get(count_str[-1:].upper())
     
-    # Plain number
     try:
+        if multiplier:
+            return int(float(count_str[:-1]) * multiplier)
+        
+        # Plain number
         return int(float(count_str))
     except ValueError:
         return None